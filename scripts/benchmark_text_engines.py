@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Compare clean_calendar_text backends on saved venue pages."""
+import argparse
+import time
+from pathlib import Path
+from venue_data.text_extraction import TEXT_ENGINES, extract_text
+
+def benchmark(paths: list, engines: list, repeat: int = 3):
+    """Time each engine on each page and check its output against bs4."""
+    for path in paths:
+        html = Path(path).read_text(errors='replace')
+        print(f"\n{path} ({len(html) / 1024:.0f} KB)")
+        print("-" * 40)
+
+        reference = extract_text(html, 'bs4')
+        for engine in engines:
+            try:
+                best = None
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    text = extract_text(html, engine)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+            except ImportError as e:
+                print(f"  {engine:<8} skipped ({e})")
+                continue
+
+            match = "same as bs4" if text == reference else "differs from bs4"
+            print(f"  {engine:<8} {best * 1000:8.1f} ms  {len(html) / best / 1e6:6.1f} MB/s  {match}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("pages", nargs="+", help="Saved HTML pages to benchmark")
+    parser.add_argument("--engine", action="append", choices=sorted(TEXT_ENGINES),
+                       help="Engine to include (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per engine; the best time is reported")
+    args = parser.parse_args()
+
+    benchmark(args.pages, args.engine or list(TEXT_ENGINES), args.repeat)
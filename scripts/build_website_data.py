@@ -4,7 +4,7 @@ import json
 from pathlib import Path
 from venue_data.storage import load_venue_config
 from venue_data.text_utils import get_next_months
-import yaml
+from venue_data.yaml_cache import load_yaml
 import logging
 
 logger = logging.getLogger(__name__)
@@ -43,14 +43,13 @@ def build_website_data():
                     continue
                     
                 try:
-                    with open(playlist_file) as f:
-                        data = yaml.safe_load(f)
-                        # Skip test playlists
-                        if "[TEST]" in data.get("playlist_url", ""):
-                            continue
-                        venue_data["months"][month] = {
-                            "playlist_url": data["playlist_url"]
-                        }
+                    data = load_yaml(playlist_file)
+                    # Skip test playlists
+                    if "[TEST]" in data.get("playlist_url", ""):
+                        continue
+                    venue_data["months"][month] = {
+                        "playlist_url": data["playlist_url"]
+                    }
                 except Exception as e:
                     logger.error(f"Error processing {playlist_file}: {e}")
                     continue
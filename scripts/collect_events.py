@@ -1,9 +1,12 @@
-from venue_data.venue_processor import process_venue
+from venue_data.collector import collect_venues, DEFAULT_WORKERS
+from venue_data.rate_limit import DEFAULT_MAX_PER_HOST
 from venue_data.storage import load_venue_config
+from venue_data.scraper_factory import ScraperFactory
 from pathlib import Path
 import argparse
 
-def process_city(city: str = "sf", force_venue: str = None, force_all: bool = False) -> None:
+def process_city(city: str = "sf", force_venue: str = None, force_all: bool = False,
+                 workers: int = DEFAULT_WORKERS, max_per_host: int = DEFAULT_MAX_PER_HOST) -> None:
     """Process venues for a specific city."""
     print(f"\nProcessing {city.upper()} venues:")
     print("-" * 40)
@@ -17,18 +20,32 @@ def process_city(city: str = "sf", force_venue: str = None, force_all: bool = Fa
             return
         venues = {force_venue: venues[force_venue]}
     
-    for venue_key in venues:
-        print(f"\nProcessing {venue_key}...")
-        output_files = process_venue(venue_key, force=bool(force_venue or force_all))
+    print(f"\nProcessing {len(venues)} venues with {workers} workers...")
+    changed = {}
+    try:
+        results = collect_venues(
+            venues,
+            force=bool(force_venue or force_all),
+            max_workers=workers,
+            max_per_host=max_per_host,
+            changed=changed
+        )
+        for venue_key, output_files in results.items():
+            print(f"\nProcessed {venue_key}. Results saved to:")
+            for file in output_files:
+                print(f"  - {file}")
         
-        print(f"\nProcessed {venue_key}. Results saved to:")
-        for file in output_files:
-            print(f"  - {file}")
+        changed_months = [f"{venue_key} {month}" for venue_key, months in changed.items() for month in months]
+        print(f"\nChanged venue-months: {', '.join(changed_months) if changed_months else 'none'}")
+    finally:
+        ScraperFactory.shutdown()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--force", help="Force update for specific venue key")
     parser.add_argument("--force-all", action="store_true", help="Force update all venues")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of venues to collect concurrently")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_MAX_PER_HOST, help="Maximum concurrent requests per host")
     args = parser.parse_args()
     
-    process_city(force_venue=args.force, force_all=args.force_all)
\ No newline at end of file
+    process_city(force_venue=args.force, force_all=args.force_all, workers=args.workers, max_per_host=args.per_host)
\ No newline at end of file
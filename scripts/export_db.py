@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""Write the SQLite event store back out as YAML venue data files."""
+import argparse
+import logging
+from venue_data.db import EventStore, VENUE_DB
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db", default=VENUE_DB, required=not VENUE_DB, help="SQLite file (default: $VENUE_DB)")
+    parser.add_argument("--city", help="Only export this city")
+    parser.add_argument("--output", default="data/venue-data", help="Base directory for the YAML files")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    store = EventStore(args.db)
+    try:
+        store.export_yaml(args.output, args.city)
+    finally:
+        store.close()
@@ -1,69 +1,100 @@
 from pathlib import Path
 from venue_data.storage import load_venue_config, needs_update
 from venue_data.text_utils import get_next_months
+from venue_data.db import get_event_store, city_from_path
+from venue_data.yaml_cache import load_yaml
 from playlist_data.generator import PlaylistGenerator
 from playlist_data.storage import save_playlist_info
-import yaml
-import time
+from playlist_data.resolution import resolve_all, playlist_tracks
 import argparse
 
 def load_artists_for_month(venue_key: str, month: str, city_path: str) -> list:
-    """Load artists from venue's monthly YAML file."""
+    """Load artists from the event store if enabled, else from venue's monthly YAML file."""
+    store = get_event_store()
+    if store:
+        artists = store.venue_artists(city_from_path(city_path), venue_key, month)
+        if artists is not None:
+            return artists
+    
     filepath = Path(city_path) / venue_key / f"artists_{month}.yaml"
     if not filepath.exists():
         return []
     
-    with open(filepath, 'r') as f:
-        data = yaml.safe_load(f)
-        return data.get('artists', [])
+    data = load_yaml(filepath)
+    return data.get('artists', [])
+
+def load_playlist_url(venue_key: str, month: str, city_path: str) -> str:
+    """URL of the playlist recorded for a venue-month, or '' if there is none."""
+    filepath = Path(city_path) / venue_key / f"playlist_{month}.yaml"
+    if not filepath.exists():
+        return ""
+    
+    return load_yaml(filepath).get('playlist_url', "")
 
-def process_city_playlists(city: str, force_venue: str = None, force_all: bool = False):
-    """Create playlists for all venues in a city."""
+def process_city_playlists(city: str, force_venue: str = None, force_all: bool = False, recreate: bool = False):
+    """Create or update playlists for all venues in a city.
+    
+    A venue-month with a recorded playlist is updated in place with only the
+    track changes, unless ``recreate`` is set.
+    """
     base_dir = "data/venue-data"
     city_path = f"{base_dir}/{city}"
     venues = load_venue_config(f"{city_path}/venues.yaml")
     generator = PlaylistGenerator()
     
+    # Load every stale venue-month first so each artist is resolved once per city
+    pending = {}
     for month in get_next_months():
-        print(f"\nProcessing playlists for {month}:")
-        print("-" * 40)
-        
         for venue_key, venue_info in venues.items():
             if force_venue and venue_key != force_venue:
                 continue
                 
             # Skip if playlist is up to date and not forced
             if not (force_venue or force_all) and not needs_update(venue_key, month, city_path):
-                print(f"Skipping {venue_info['name']} - playlist is up to date")
+                print(f"Skipping {venue_info['name']} in {month} - playlist is up to date")
                 continue
                 
             artists = load_artists_for_month(venue_key, month, city_path)
             if not artists:
                 print(f"No artists found for {venue_info['name']} in {month}")
                 continue
-            
-            print(f"Found {len(artists)} artists for {venue_info['name']}")
-            all_tracks = []
-            for artist in artists:
-                tracks = generator.search_artist_top_tracks(artist)
-                if not tracks:
+            pending[(venue_key, month)] = artists
+    
+    # Each artist is resolved once per city; a venue-month only looks up artists
+    # no earlier venue-month had, and its playlist is saved before moving on
+    resolved = {}
+    for (venue_key, month), artists in pending.items():
+        venue_info = venues[venue_key]
+        print(f"\nFound {len(artists)} artists for {venue_info['name']} in {month}")
+        try:
+            known = set(resolved)
+            # Lookups run concurrently; the generator's shared limiter paces Spotify calls
+            resolve_all(generator, [artists], resolved)
+            for artist, tracks in resolved.items():
+                if artist not in known and not tracks:
                     print(f"No tracks found for artist: {artist}")
-                all_tracks.extend(tracks)
-                time.sleep(0.5)
+            all_tracks = playlist_tracks(artists, resolved)
             
             if all_tracks:
-                playlist_url = generator.create_venue_playlist(venue_info['name'], month, all_tracks)
+                existing_url = "" if recreate else load_playlist_url(venue_key, month, city_path)
+                if existing_url and "[TEST]" not in existing_url:
+                    playlist_url = generator.update_venue_playlist(existing_url, venue_info['name'], month, all_tracks)
+                else:
+                    playlist_url = generator.create_venue_playlist(venue_info['name'], month, all_tracks)
                 if playlist_url:
                     save_playlist_info(venue_key, month, playlist_url, city_path)
-                    print(f"Created playlist for {venue_info['name']}: {playlist_url}")
-                    time.sleep(1)
+                    print(f"Saved playlist for {venue_info['name']}: {playlist_url}")
             else:
                 print(f"No tracks found for any artists at {venue_info['name']} in {month}")
+        except Exception as e:
+            print(f"Error processing playlist for {venue_info['name']} in {month}: {str(e)}")
+    
+    print(f"\nResolved {len(resolved)} unique artists for {len(pending)} venue-months")
 
-def generate_playlists():
+def generate_playlists(recreate: bool = False):
     cities = [d.name for d in Path("data/venue-data").iterdir() if d.is_dir()]
     for city in cities:
-        process_city_playlists(city)
+        process_city_playlists(city, recreate=recreate)
 
 def main():
     parser = argparse.ArgumentParser()
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""Print the venue-months whose playlists are stale, and why."""
+import argparse
+from pathlib import Path
+from venue_data.manifest import plan
+from venue_data.storage import load_venue_config
+from venue_data.text_utils import get_next_months
+
+def plan_city(city: str, base_dir: str = "data/venue-data") -> list:
+    """Print and return the stale (venue, month, reason) entries for a city."""
+    city_path = Path(base_dir) / city
+    venues = load_venue_config(city_path / "venues.yaml")
+    stale = plan(city_path, venues, get_next_months())
+
+    print(f"\n{city.upper()}: {len(stale)} stale venue-months")
+    print("-" * 40)
+    for venue_key, month, reason in stale:
+        print(f"  {venue_key:<30} {month:<16} {reason}")
+    return stale
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("cities", nargs="*", help="Cities to plan (default: all)")
+    parser.add_argument("--base-dir", default="data/venue-data", help="Directory holding the city folders")
+    args = parser.parse_args()
+
+    cities = args.cities or sorted(d.name for d in Path(args.base_dir).iterdir() if d.is_dir())
+    for city in cities:
+        plan_city(city, args.base_dir)
@@ -0,0 +1,102 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+from typing import List, Optional, Tuple
+from venue_data.disk_cache import CACHE_DIR
+
+# SQLite file for resolved artists and their top tracks
+ARTIST_CACHE_DB = os.environ.get('ARTIST_CACHE_DB', os.path.join(CACHE_DIR, 'spotify_artists.db'))
+
+# Artist IDs rarely change; top tracks drift; "not found" is retried sooner
+ARTIST_ID_TTL_DAYS = float(os.environ.get('ARTIST_ID_TTL_DAYS', 90))
+TOP_TRACKS_TTL_DAYS = float(os.environ.get('TOP_TRACKS_TTL_DAYS', 7))
+ARTIST_NOT_FOUND_TTL_DAYS = float(os.environ.get('ARTIST_NOT_FOUND_TTL_DAYS', 7))
+
+DAY = 24 * 3600
+
+def normalize_artist_name(name: str) -> str:
+    """Cache key for an artist name: Unicode-normalized, case-folded, single-spaced."""
+    return ' '.join(unicodedata.normalize('NFKC', name).casefold().split())
+
+class ArtistCache:
+    """Persistent maps from artist name to Spotify artist ID and from artist ID to top-track URIs.
+
+    A name that Spotify couldn't find is stored with no ID, so it isn't
+    searched again until ``not_found_ttl`` passes.
+    """
+
+    def __init__(self, path: str = ARTIST_CACHE_DB, artist_ttl: float = ARTIST_ID_TTL_DAYS * DAY,
+                 tracks_ttl: float = TOP_TRACKS_TTL_DAYS * DAY, not_found_ttl: float = ARTIST_NOT_FOUND_TTL_DAYS * DAY):
+        self.artist_ttl = artist_ttl
+        self.tracks_ttl = tracks_ttl
+        self.not_found_ttl = not_found_ttl
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS artist_ids (
+                name TEXT PRIMARY KEY,
+                artist_id TEXT,
+                resolved REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS top_tracks (
+                artist_id TEXT PRIMARY KEY,
+                uris TEXT NOT NULL,
+                fetched REAL NOT NULL
+            );
+        """)
+        self._lock = threading.Lock()
+
+    def lookup_artist(self, name: str) -> Tuple[bool, Optional[str]]:
+        """Return (cached, artist_id); a cached None means Spotify had no match."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT artist_id, resolved FROM artist_ids WHERE name = ?", (normalize_artist_name(name),)
+            ).fetchone()
+        if row is None:
+            return False, None
+        artist_id, resolved = row
+        ttl = self.artist_ttl if artist_id else self.not_found_ttl
+        if time.time() - resolved > ttl:
+            return False, None
+        return True, artist_id
+
+    def set_artist(self, name: str, artist_id: Optional[str]) -> None:
+        """Remember an artist's ID, or None if the search found nothing."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artist_ids (name, artist_id, resolved) VALUES (?, ?, ?)",
+                (normalize_artist_name(name), artist_id, time.time())
+            )
+
+    def get_top_tracks(self, artist_id: str) -> Optional[List[str]]:
+        """Cached top-track URIs for an artist, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT uris, fetched FROM top_tracks WHERE artist_id = ?", (artist_id,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.tracks_ttl:
+            return None
+        return json.loads(row[0])
+
+    def set_top_tracks(self, artist_id: str, uris: List[str]) -> None:
+        """Remember an artist's top-track URIs."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO top_tracks (artist_id, uris, fetched) VALUES (?, ?, ?)",
+                (artist_id, json.dumps(uris), time.time())
+            )
+
+_shared_cache: Optional[ArtistCache] = None
+_shared_cache_lock = threading.Lock()
+
+def get_artist_cache() -> ArtistCache:
+    """Return the process-wide artist cache."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ArtistCache()
+        return _shared_cache
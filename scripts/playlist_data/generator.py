@@ -1,11 +1,20 @@
-from typing import List
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 import spotipy
+from spotipy.exceptions import SpotifyException
 from spotipy.oauth2 import SpotifyOAuth
+from venue_data.rate_limit import spotify_session
 from . import config
+from .artist_cache import ArtistCache, get_artist_cache
+from .rate_limit import AdaptiveRateLimiter, get_spotify_limiter, SPOTIFY_MAX_CONCURRENCY
+import random
 import time
 
 class PlaylistGenerator:
-    def __init__(self):
+    def __init__(self, artist_cache: Optional[ArtistCache] = None, limiter: Optional[AdaptiveRateLimiter] = None):
+        self.artist_cache = artist_cache or get_artist_cache()
+        self.limiter = limiter or get_spotify_limiter()
+        self._user_id = None
         if not config.SPOTIFY_CONFIG.get('refresh_token'):
             from . import auth
             auth.setup_spotify_auth()
@@ -25,7 +34,8 @@ class PlaylistGenerator:
         auth_manager.refresh_token = config.SPOTIFY_CONFIG['refresh_token']
         
         try:
-            self.sp = spotipy.Spotify(auth_manager=auth_manager)
+            # 429s surface as exceptions (with Retry-After) for the shared limiter to handle
+            self.sp = spotipy.Spotify(auth_manager=auth_manager, requests_session=spotify_session())
             user = self.sp.me()
             print(f"\nAuthenticated as Spotify user: {user['display_name']}")
         except Exception as e:
@@ -33,34 +43,57 @@ class PlaylistGenerator:
             print(f"Error: {str(e)}")
             raise
     
+    def resolve_artists(self, artist_names: List[str]) -> Dict[str, List[str]]:
+        """Look up top-track URIs for many artists concurrently, keyed by name in first-seen order.
+
+        A name given more than once is looked up once and appears once in the result.
+        """
+        names = list(dict.fromkeys(artist_names))
+        if not names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(SPOTIFY_MAX_CONCURRENCY, len(names))) as executor:
+            return dict(zip(names, executor.map(self.search_artist_top_tracks, names)))
+    
     def search_artist_top_tracks(self, artist_name: str, max_retries: int = 3) -> List[str]:
-        """Search for an artist's top tracks and return their URIs."""
+        """Search for an artist's top tracks and return their URIs, using the artist cache first."""
+        cached, artist_id = self.artist_cache.lookup_artist(artist_name)
         for attempt in range(max_retries):
             try:
-                results = self.sp.search(q=artist_name, type='artist', limit=1)
-                if not results['artists']['items']:
+                if not cached:
+                    results = self.limiter.call(self.sp.search, q=artist_name, type='artist', limit=1)
+                    items = results['artists']['items']
+                    artist_id = items[0]['id'] if items else None
+                    self.artist_cache.set_artist(artist_name, artist_id)
+                    cached = True
+                if artist_id is None:
                     return []
                 
-                artist_id = results['artists']['items'][0]['id']
-                top_tracks = self.sp.artist_top_tracks(artist_id)
+                uris = self.artist_cache.get_top_tracks(artist_id)
+                if uris is None:
+                    top_tracks = self.limiter.call(self.sp.artist_top_tracks, artist_id)
+                    uris = [track['uri'] for track in top_tracks['tracks']]
+                    self.artist_cache.set_top_tracks(artist_id, uris)
                 
-                return [
-                    track['uri'] 
-                    for track in top_tracks['tracks'][:config.TRACKS_PER_ARTIST]
-                ]
+                return uris[:config.TRACKS_PER_ARTIST]
             except Exception as e:
+                if isinstance(e, SpotifyException) and e.http_status == 429:
+                    # The limiter already retried; more attempts would only add to the throttling
+                    print(f"Error finding tracks for {artist_name}: still rate limited")
+                    return []
                 if attempt == max_retries - 1:
                     print(f"Error finding tracks for {artist_name}: {str(e)}")
                     return []
                 print(f"Retry {attempt + 1} for {artist_name}")
-                time.sleep(1)  # Wait 1 second before retry
+                # Throttling is handled by the limiter; back off briefly for other errors
+                time.sleep(2 ** attempt * 0.5 + random.uniform(0, 0.5))
 
     def create_venue_playlist(self, venue_name: str, month: str, track_uris: List[str]) -> str:
         """Create a Spotify playlist for a venue's monthly artists."""
         try:
             playlist_name = f"{venue_name} - {month.replace('_', ' ').title()}"
-            playlist = self.sp.user_playlist_create(
-                user=self.sp.me()['id'],
+            playlist = self.limiter.call(
+                self.sp.user_playlist_create,
+                user=self.user_id,
                 name=playlist_name,
                 description=f"Top tracks from artists playing at {venue_name} in {month}"
             )
@@ -68,7 +101,7 @@ class PlaylistGenerator:
             if track_uris:
                 for i in range(0, len(track_uris), 100):
                     batch = track_uris[i:i+100]
-                    self.sp.playlist_add_items(playlist['id'], batch)
+                    self.limiter.call(self.sp.playlist_add_items, playlist['id'], batch)
             
             # Get playlist URL from different fields
             if 'external_urls' in playlist and 'spotify' in playlist['external_urls']:
@@ -83,4 +116,66 @@ class PlaylistGenerator:
             print(f"Error creating playlist: {str(e)}")
             if 'playlist' in locals():
                 print(f"Playlist data: {playlist}")
-            return ""
\ No newline at end of file
+            return ""
+    
+    @property
+    def user_id(self) -> str:
+        """The authenticated user's Spotify ID, fetched once."""
+        if self._user_id is None:
+            self._user_id = self.limiter.call(self.sp.me)['id']
+        return self._user_id
+    
+    def playlist_track_uris(self, playlist_id: str) -> List[str]:
+        """All track URIs currently in a playlist, following pagination."""
+        page = self.limiter.call(self.sp.playlist_items, playlist_id,
+                                 fields='items(track(uri)),next', additional_types=('track',))
+        uris = []
+        while page:
+            uris.extend(item['track']['uri'] for item in page['items'] if item.get('track'))
+            page = self.limiter.call(self.sp.next, page) if page.get('next') else None
+        return uris
+    
+    def update_venue_playlist(self, playlist_url: str, venue_name: str, month: str, track_uris: List[str]) -> str:
+        """Bring an existing playlist to the desired tracks with minimal remove/add calls.
+        
+        When removing and appending tracks would leave them out of the listing's
+        order, the playlist's items are replaced instead. Falls back to creating
+        a new playlist if the recorded one can't be read. Returns the playlist
+        URL, unchanged when the playlist was updated in place.
+        """
+        playlist_id = playlist_id_from_url(playlist_url)
+        try:
+            current = self.playlist_track_uris(playlist_id)
+        except Exception as e:
+            print(f"Could not read playlist {playlist_id}, creating a new one: {str(e)}")
+            return self.create_venue_playlist(venue_name, month, track_uris)
+        
+        desired = list(dict.fromkeys(track_uris))
+        desired_set = set(desired)
+        current_set = set(current)
+        to_remove = [uri for uri in dict.fromkeys(current) if uri not in desired_set]
+        to_add = [uri for uri in desired if uri not in current_set]
+        kept = [uri for uri in current if uri in desired_set]
+        
+        try:
+            if kept + to_add == desired:
+                for i in range(0, len(to_remove), 100):
+                    self.limiter.call(self.sp.playlist_remove_all_occurrences_of_items, playlist_id, to_remove[i:i+100])
+                for i in range(0, len(to_add), 100):
+                    self.limiter.call(self.sp.playlist_add_items, playlist_id, to_add[i:i+100])
+            else:
+                # Replacing sets the first 100 tracks in order; the rest are appended
+                self.limiter.call(self.sp.playlist_replace_items, playlist_id, desired[:100])
+                for i in range(100, len(desired), 100):
+                    self.limiter.call(self.sp.playlist_add_items, playlist_id, desired[i:i+100])
+                print(f"Reordered playlist for {venue_name} {month} to match the listing")
+        except Exception as e:
+            print(f"Error updating playlist {playlist_id}: {str(e)}")
+            return ""
+        
+        print(f"Updated playlist for {venue_name} {month}: -{len(to_remove)} +{len(to_add)} tracks")
+        return playlist_url
+
+def playlist_id_from_url(playlist_url: str) -> str:
+    """Playlist ID from an open.spotify.com or API playlist URL."""
+    return playlist_url.split('?')[0].rstrip('/').split('/')[-1]
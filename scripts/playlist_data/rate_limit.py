@@ -0,0 +1,96 @@
+import os
+import time
+import threading
+from typing import Callable, Optional, TypeVar
+from spotipy.exceptions import SpotifyException
+
+T = TypeVar('T')
+
+# Concurrent Spotify lookups and the request rate (per second) they share
+SPOTIFY_MAX_CONCURRENCY = int(os.environ.get('SPOTIFY_MAX_CONCURRENCY', 8))
+SPOTIFY_RATE = float(os.environ.get('SPOTIFY_RATE', 5))
+SPOTIFY_MIN_RATE = float(os.environ.get('SPOTIFY_MIN_RATE', 0.5))
+SPOTIFY_MAX_RATE = float(os.environ.get('SPOTIFY_MAX_RATE', 20))
+
+# Times a throttled call is retried before giving up
+MAX_THROTTLE_RETRIES = 5
+
+class AdaptiveRateLimiter:
+    """Token bucket whose rate adapts to Spotify's responses.
+
+    Each success nudges the rate up by ``increase`` requests/second; a 429
+    cuts it by ``decrease_factor`` and pauses every caller for the response's
+    Retry-After seconds.
+    """
+
+    def __init__(self, rate: float = SPOTIFY_RATE, min_rate: float = SPOTIFY_MIN_RATE,
+                 max_rate: float = SPOTIFY_MAX_RATE, burst: float = 1.0,
+                 increase: float = 0.1, decrease_factor: float = 0.5):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(delay)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after: float) -> None:
+        """Slow down after a 429 and hold all requests until Retry-After has passed."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = 0
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        print(f"Spotify rate limit hit, pausing {retry_after:.0f}s and slowing to {self.rate:.1f} req/s")
+
+    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Call a Spotify API method within the rate, retrying it when throttled."""
+        for attempt in range(MAX_THROTTLE_RETRIES + 1):
+            self.acquire()
+            try:
+                result = func(*args, **kwargs)
+            except SpotifyException as e:
+                if e.http_status != 429 or attempt == MAX_THROTTLE_RETRIES:
+                    raise
+                self.on_throttle(retry_after_seconds(e))
+                continue
+            self.on_success()
+            return result
+
+def retry_after_seconds(error: SpotifyException, default: float = 1.0) -> float:
+    """Seconds to wait from a 429 response's Retry-After header."""
+    headers = error.headers or {}
+    try:
+        return max(float(headers.get('Retry-After', default)), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+_shared_limiter: Optional[AdaptiveRateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+def get_spotify_limiter() -> AdaptiveRateLimiter:
+    """Return the process-wide Spotify rate limiter."""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = AdaptiveRateLimiter()
+        return _shared_limiter
@@ -0,0 +1,57 @@
+import re
+from typing import Dict, Iterable, List, Optional
+from .artist_cache import normalize_artist_name
+
+# Explicit joiners between a headliner and featured or supporting acts in listing names;
+# bare "+", "plus" or "support" are left alone since they appear in band names
+CREDIT_SEPARATORS = re.compile(
+    r'\s+(?:feat\.?|ft\.?|featuring|w/|with\s+special\s+guests?:?|supported\s+by:?)\s+|\s*\|\s*',
+    re.IGNORECASE
+)
+
+def split_artist_credits(name: str) -> List[str]:
+    """Split a listing like 'Headliner feat. Guest w/ Opener' into artist names as written.
+
+    Names that normalize to the same key are kept once, in their first spelling.
+    """
+    credits = {}
+    for part in CREDIT_SEPARATORS.split(name):
+        credit = ' '.join(part.strip(' ,;:-').split())
+        if credit:
+            credits.setdefault(normalize_artist_name(credit), credit)
+    return list(credits.values())
+
+def unique_artists(artist_lists: Iterable[List[str]]) -> Dict[str, str]:
+    """Map each normalized artist name across venue-month lists to its first-seen spelling."""
+    seen = {}
+    for artists in artist_lists:
+        for name in artists:
+            for credit in split_artist_credits(name):
+                seen.setdefault(normalize_artist_name(credit), credit)
+    return seen
+
+def resolve_all(generator, artist_lists: Iterable[List[str]],
+                resolved: Optional[Dict[str, List[str]]] = None) -> Dict[str, List[str]]:
+    """Resolve every artist in the lists not already in ``resolved``, keyed by normalized name.
+
+    Spotify is searched with each artist's first-seen spelling. Newly resolved
+    artists are added to ``resolved``, which is returned.
+    """
+    resolved = {} if resolved is None else resolved
+    pending = {key: name for key, name in unique_artists(artist_lists).items() if key not in resolved}
+    tracks = generator.resolve_artists(list(pending.values()))
+    for key, name in pending.items():
+        resolved[key] = tracks.get(name, [])
+    return resolved
+
+def playlist_tracks(artists: List[str], resolved: Dict[str, List[str]]) -> List[str]:
+    """Track URIs for a venue-month's listing, read from the resolved map without repeats."""
+    tracks = []
+    seen = set()
+    for name in artists:
+        for credit in split_artist_credits(name):
+            for uri in resolved.get(normalize_artist_name(credit), []):
+                if uri not in seen:
+                    seen.add(uri)
+                    tracks.append(uri)
+    return tracks
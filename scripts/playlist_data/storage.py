@@ -1,11 +1,16 @@
-import yaml
 from pathlib import Path
 from datetime import datetime
+from venue_data.db import get_event_store, city_from_path
+from venue_data.storage import write_yaml_if_changed
+from venue_data.manifest import record_playlist
 
-def save_playlist_info(venue_key: str, month: str, playlist_url: str, city_path: str):
-    """Save playlist URL and metadata to YAML file."""
-    output_dir = Path(city_path) / venue_key
-    filename = output_dir / f"playlist_{month}.yaml"
+def save_playlist_info(venue_key: str, month: str, playlist_url: str, city_path: str) -> bool:
+    """Save playlist URL and metadata to YAML file; returns False if it was already recorded.
+    
+    The freshness manifest and event store are updated either way, since a
+    playlist updated in place keeps its URL but was still regenerated.
+    """
+    filename = Path(city_path) / venue_key / f"playlist_{month}.yaml"
     
     data = {
         'venue': venue_key,
@@ -14,6 +19,10 @@ def save_playlist_info(venue_key: str, month: str, playlist_url: str, city_path:
         'created': datetime.now().isoformat()
     }
     
-    output_dir.mkdir(parents=True, exist_ok=True)
-    with open(filename, 'w') as f:
-        yaml.safe_dump(data, f, sort_keys=False) 
\ No newline at end of file
+    changed = write_yaml_if_changed(filename, data)
+    
+    record_playlist(city_path, venue_key, month, playlist_url, data['created'])
+    store = get_event_store()
+    if store:
+        store.save_playlist(city_from_path(city_path), venue_key, month, playlist_url, data['created'])
+    return changed
@@ -22,6 +22,17 @@ from playlist_data import (
     PlaylistGenerator,
     save_playlist_info
 )
+from playlist_data.artist_cache import ArtistCache
+from playlist_data.generator import spotify_session
+from playlist_data.rate_limit import AdaptiveRateLimiter
+from playlist_data import rate_limit
+from playlist_data.resolution import split_artist_credits, resolve_all, playlist_tracks
+from spotipy.exceptions import SpotifyException
+import spotipy
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import time
 import pytest
 import logging
 from pathlib import Path
@@ -116,4 +127,209 @@ def test_playlist_creation(generator, test_output_dir):
 
 def run_playlist_tests():
     """Run all playlist tests."""
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
+
+@pytest.fixture
+def offline_generator(tmp_path):
+    """Playlist generator with a temporary artist cache and no Spotify login; tests set ``sp``."""
+    generator = PlaylistGenerator.__new__(PlaylistGenerator)
+    generator.sp = None
+    generator.artist_cache = ArtistCache(str(tmp_path / "artists.db"))
+    generator.limiter = AdaptiveRateLimiter(rate=1000, max_rate=1000, burst=20)
+    return generator
+
+class FakeSpotify:
+    """Counts search and top-track calls."""
+    
+    def __init__(self, known):
+        self.known = known
+        self.searches = 0
+        self.top_track_calls = 0
+    
+    def search(self, q, type, limit):
+        self.searches += 1
+        items = [{'id': self.known[q]}] if q in self.known else []
+        return {'artists': {'items': items}}
+    
+    def artist_top_tracks(self, artist_id):
+        self.top_track_calls += 1
+        return {'tracks': [{'uri': f"spotify:track:{artist_id}-{i}"} for i in range(3)]}
+
+def test_artist_cache_skips_repeat_lookups(offline_generator, tmp_path):
+    """Test resolved and unknown artists are served from the persistent cache."""
+    generator = offline_generator
+    sp = generator.sp = FakeSpotify({"The Beatles": "beatles"})
+    
+    assert generator.search_artist_top_tracks("The Beatles") == ["spotify:track:beatles-0"]
+    assert generator.search_artist_top_tracks("Unknown Band") == []
+    
+    # A new run with the same cache file and a differently written name
+    generator.artist_cache = ArtistCache(str(tmp_path / "artists.db"))
+    assert generator.search_artist_top_tracks("the  BEATLES") == ["spotify:track:beatles-0"]
+    assert generator.search_artist_top_tracks("Unknown Band") == []
+    assert (sp.searches, sp.top_track_calls) == (2, 1), "Cached artists should not be searched again"
+    
+    generator.artist_cache.tracks_ttl = 0
+    generator.artist_cache.not_found_ttl = 0
+    generator.search_artist_top_tracks("The Beatles")
+    generator.search_artist_top_tracks("Unknown Band")
+    assert (sp.searches, sp.top_track_calls) == (3, 2), "Expired entries should be refreshed separately"
+
+def test_rate_limiter_honors_retry_after():
+    """Test a 429 pauses callers for Retry-After, slows the rate and then retries."""
+    limiter = AdaptiveRateLimiter(rate=100, min_rate=1, max_rate=200)
+    calls = []
+    
+    def flaky():
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            raise SpotifyException(429, -1, "rate limited", headers={'Retry-After': '0.2'})
+        return "ok"
+    
+    assert limiter.call(flaky) == "ok"
+    assert calls[1] - calls[0] >= 0.2, "Retry should wait for Retry-After"
+    assert limiter.rate < 100, "Throttling should lower the rate"
+
+def test_spotify_429_reaches_rate_limiter():
+    """Test a real spotipy client hands each 429 to the limiter instead of retrying it inside urllib3."""
+    requests_seen = []
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append(self.path)
+            if len(requests_seen) <= 2:
+                body, status = b'{"error": {"status": 429, "message": "API rate limit exceeded"}}', 429
+            else:
+                body, status = json.dumps({'artists': {'items': [{'id': 'beatles'}]}}).encode(), 200
+            self.send_response(status)
+            if status == 429:
+                self.send_header('Retry-After', '0')
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        sp = spotipy.Spotify(auth="token", requests_session=spotify_session())
+        sp.prefix = f"http://127.0.0.1:{server.server_port}/v1/"
+        limiter = AdaptiveRateLimiter(rate=1000, min_rate=1, max_rate=1000)
+        results = limiter.call(sp.search, q="The Beatles", type='artist', limit=1)
+    finally:
+        server.shutdown()
+    
+    assert results['artists']['items'] == [{'id': 'beatles'}]
+    assert len(requests_seen) == 3, "Each 429 should be retried by the limiter, once per attempt"
+    assert limiter.rate < 300, "Both 429s should have slowed the limiter"
+
+def test_resolve_artists_concurrently(offline_generator):
+    """Test concurrent artist resolution keeps input order."""
+    names = [f"Artist {i}" for i in range(20)]
+    generator = offline_generator
+    generator.sp = FakeSpotify({name: name.replace(" ", "") for name in names})
+    
+    resolved = generator.resolve_artists(names + ["Artist 3"])
+    
+    assert list(resolved) == names, "Duplicate names should be resolved once"
+    assert resolved["Artist 3"] == ["spotify:track:Artist3-0"]
+    assert generator.sp.searches == len(names)
+
+def test_throttled_artist_not_retried_past_limiter(offline_generator, monkeypatch):
+    """Test a 429 the limiter gave up on isn't retried again by the artist lookup."""
+    monkeypatch.setattr(rate_limit, "MAX_THROTTLE_RETRIES", 1)
+    calls = []
+    
+    class ThrottledSpotify:
+        def search(self, **kwargs):
+            calls.append(kwargs)
+            raise SpotifyException(429, -1, "rate limited", headers={'Retry-After': '0'})
+    
+    offline_generator.sp = ThrottledSpotify()
+    
+    assert offline_generator.search_artist_top_tracks("Big Thief") == []
+    assert len(calls) == 2, "Only the limiter's attempts should reach Spotify"
+
+def test_city_artists_resolved_once(offline_generator):
+    """Test artists shared across venue-months and credits are resolved once and reused."""
+    generator = offline_generator
+    # Only the listed spellings are known, so lookups must not use the normalized keys
+    sp = generator.sp = FakeSpotify({"Phoebe Bridgers": "phoebe", "MUNA": "muna", "Big Thief": "bigthief"})
+    venue_months = {
+        ("venue_a", "November_2026"): ["Phoebe Bridgers feat. MUNA", "Big Thief"],
+        ("venue_b", "December_2026"): ["PHOEBE  BRIDGERS", "Big Thief w/ Muna"],
+    }
+    
+    assert split_artist_credits("Phoebe Bridgers feat. MUNA") == ["Phoebe Bridgers", "MUNA"]
+    assert split_artist_credits("Florence + the Machine") == ["Florence + the Machine"]
+    assert split_artist_credits("Tech Support Group supported by Big Thief") == ["Tech Support Group", "Big Thief"]
+    resolved = resolve_all(generator, venue_months.values())
+    
+    assert sp.searches == 3, "Each artist should be searched once per city"
+    assert playlist_tracks(venue_months[("venue_b", "December_2026")], resolved) == [
+        "spotify:track:phoebe-0", "spotify:track:bigthief-0", "spotify:track:muna-0"
+    ]
+    
+    asked = []
+    class RecordingGenerator:
+        def resolve_artists(self, names):
+            asked.append(names)
+            return {name: [] for name in names}
+    
+    shared = {}
+    for artists in venue_months.values():
+        resolve_all(RecordingGenerator(), [artists], shared)
+    assert asked == [["Phoebe Bridgers", "MUNA", "Big Thief"], []], \
+        "Venue-months resolved in turn should only look up artists not seen before"
+
+class FakePlaylistSpotify:
+    """Paged playlist that records write calls."""
+    
+    def __init__(self, uris, page_size=2):
+        self.uris = list(uris)
+        self.page_size = page_size
+        self.calls = []
+    
+    def _page(self, offset):
+        items = [{'track': {'uri': uri}} for uri in self.uris[offset:offset + self.page_size]]
+        more = offset + self.page_size < len(self.uris)
+        return {'items': items, 'next': offset + self.page_size if more else None}
+    
+    def playlist_items(self, playlist_id, fields=None, additional_types=None):
+        return self._page(0)
+    
+    def next(self, page):
+        return self._page(page['next'])
+    
+    def playlist_remove_all_occurrences_of_items(self, playlist_id, items):
+        self.calls.append(("remove", list(items)))
+        self.uris = [uri for uri in self.uris if uri not in items]
+    
+    def playlist_add_items(self, playlist_id, items):
+        self.calls.append(("add", list(items)))
+        self.uris.extend(items)
+    
+    def playlist_replace_items(self, playlist_id, items):
+        self.calls.append(("replace", list(items)))
+        self.uris = list(items)
+
+def test_update_playlist_applies_minimal_diff(offline_generator):
+    """Test an existing playlist is updated in place with only the changed tracks."""
+    generator = offline_generator
+    generator.sp = FakePlaylistSpotify(["t1", "t2", "t3", "t4", "t5"])
+    url = "https://open.spotify.com/playlist/abc123"
+    
+    assert generator.update_venue_playlist(url, "Test Venue", "November_2026", ["t2", "t3", "t5", "t6"]) == url
+    assert generator.sp.calls == [("remove", ["t1", "t4"]), ("add", ["t6"])]
+    
+    generator.sp.calls.clear()
+    generator.update_venue_playlist(url, "Test Venue", "November_2026", ["t2", "t3", "t5", "t6"])
+    assert generator.sp.calls == [], "An unchanged playlist should need no write calls"
+    
+    generator.update_venue_playlist(url, "Test Venue", "November_2026", ["t6", "t2", "t3", "t7"])
+    assert generator.sp.calls == [("replace", ["t6", "t2", "t3", "t7"])], "A new order should replace the tracks"
+    assert generator.sp.uris == ["t6", "t2", "t3", "t7"]
@@ -30,8 +30,37 @@ import pytest
 from pathlib import Path
 import yaml
 import json
-from datetime import datetime
+from datetime import datetime, date, timedelta
 from venue_data.scrapers.bandisintown import BandsInTownScraper
+from venue_data.scrapers.driver_pool import DriverPool, BLOCKED_URL_PATTERNS
+from venue_data.scrapers import driver_pool
+from venue_data.scrapers.json_ld import extract_json_ld_blocks, parse_music_events
+from venue_data.rate_limit import HostRateLimiter, TokenRateLimiter
+from venue_data import collector, venue_processor
+from venue_data.disk_cache import DiskCache
+from venue_data import disk_cache
+from venue_data.http_cache import CachingHTTPAdapter
+from venue_data.rule_extractor import RuleBasedExtractor
+from venue_data.event_extraction import CalendarEventExtractor
+from venue_data.chunk_filter import ChunkFilter, PageLineCounter, strip_boilerplate
+from venue_data.event_index import EventIndex, parse_month
+from venue_data.db import EventStore, city_from_path
+from venue_data import storage, yaml_cache, manifest
+from venue_data.yaml_cache import YAMLSnapshotCache
+from venue_data.playlist_cleanup import PlaylistCleaner
+from spotipy.exceptions import SpotifyException
+from venue_data.text_extraction import extract_text
+from venue_data.scraper import clean_calendar_text
+from venue_data import scraper as venue_scraper
+from venue_data.openai_extractor import ArtistExtractor
+from venue_data import openai_extractor, text_utils
+from venue_data.text_utils import chunk_message
+import os
+import re
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+import requests
+import time
 
 @pytest.fixture
 def test_data_dir(tmp_path):
@@ -184,4 +213,650 @@ def test_scraper_factory():
     }
     scraper = ScraperFactory.get_scraper_for_venue(venue_info)
     assert isinstance(scraper, BandsInTownScraper)
-    assert scraper.scraper_type == "bandisintown"
\ No newline at end of file
+    assert scraper.scraper_type == "bandisintown"
+
+class FakeDriver:
+    """Stand-in for a WebDriver that records quit calls."""
+    
+    def __init__(self):
+        self.quit_called = False
+    
+    def quit(self):
+        self.quit_called = True
+
+def test_driver_pool_reuse_and_recycle():
+    """Test that the driver pool reuses warm drivers and recycles worn ones."""
+    launched = []
+    def factory():
+        launched.append(FakeDriver())
+        return launched[-1]
+    
+    pool = DriverPool(driver_factory=factory, max_pages=2, max_rss_mb=None)
+    
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        pass
+    assert first is second, "Pool should hand out the same warm driver"
+    assert first.quit_called, "Driver should be recycled after max_pages"
+    
+    with pool.lease() as third:
+        pass
+    assert third is not first, "Recycled driver should be replaced"
+    assert len(launched) == 2
+    
+    pool.close()
+    assert third.quit_called, "Close should quit idle drivers"
+
+def test_lean_chrome_blocks_heavy_resources(monkeypatch):
+    """Test lean mode loads pages eagerly and sends the blocked URL patterns over CDP."""
+    class FakeChrome(FakeDriver):
+        def __init__(self, options):
+            super().__init__()
+            self.options = options
+            self.cdp_commands = []
+        
+        def execute_cdp_cmd(self, cmd, params):
+            self.cdp_commands.append((cmd, params))
+    
+    monkeypatch.setattr(driver_pool.webdriver, "Chrome", FakeChrome)
+    
+    lean = driver_pool.create_chrome_driver(lean=True)
+    assert lean.options.to_capabilities()['pageLoadStrategy'] == 'eager'
+    assert ('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS}) in lean.cdp_commands
+    assert '*.css' in BLOCKED_URL_PATTERNS and '*google-analytics.com*' in BLOCKED_URL_PATTERNS
+    
+    full = driver_pool.create_chrome_driver(lean=False)
+    assert full.options.to_capabilities()['pageLoadStrategy'] == 'normal'
+    assert not any(cmd.startswith('Network.') for cmd, _ in full.cdp_commands)
+
+def test_scraper_cleanup_keeps_shared_pool():
+    """Test one scraper's cleanup leaves the shared pool's drivers to the others."""
+    pool = DriverPool(driver_factory=FakeDriver, max_rss_mb=None)
+    first, second = BandsInTownScraper(driver_pool=pool), BandsInTownScraper(driver_pool=pool)
+    with pool.lease() as driver:
+        pass
+    
+    first.cleanup()
+    
+    assert not driver.quit_called, "Cleanup should not quit drivers other scrapers share"
+    with second.driver_pool.lease() as reused:
+        assert reused is driver
+
+def test_json_ld_fast_path_parsing():
+    """Test building events from JSON-LD blocks in raw page bytes."""
+    html = b'''<html><head>
+    <script type="application/ld+json">{"@type": "Organization", "name": "BIT"}</script>
+    <script type="application/ld+json">[
+        {"@type": "MusicEvent", "performer": {"name": "Test Artist"}, "startDate": "2025-01-10T20:00:00Z"},
+        {"@type": "Place", "name": "Somewhere"}
+    ]</script>
+    <script type="application/ld+json">{not json}</script>
+    </head><body></body></html>'''
+    
+    blocks = extract_json_ld_blocks(html)
+    assert len(blocks) == 3, "Should find every JSON-LD script block"
+    
+    events = parse_music_events(blocks, "Test Venue")
+    assert len(events) == 1, "Only MusicEvent items should become events"
+    assert events[0].name == "Test Artist"
+    assert events[0].venue == "Test Venue"
+    assert events[0].date.year == 2025
+
+def test_collect_venues_concurrently(monkeypatch):
+    """Test concurrent collection keeps per-venue results in input order."""
+    def fake_process_venue(venue_key, output_dir, force, venues=None, changed_months=None):
+        if venue_key == "broken-venue":
+            raise RuntimeError("scraper failed")
+        return [f"{output_dir}/{venue_key}/artists_January_2025.yaml"]
+    
+    monkeypatch.setattr(collector, "process_venue", fake_process_venue)
+    results = collector.collect_venues(
+        ["venue-a", "broken-venue", "venue-b"],
+        output_dir="out",
+        max_workers=3,
+        min_interval=0
+    )
+    
+    assert list(results) == ["venue-a", "broken-venue", "venue-b"], "Results should keep venue order"
+    assert results["venue-a"] == ["out/venue-a/artists_January_2025.yaml"]
+    assert results["broken-venue"] == [], "Failed venues should report no output files"
+
+def test_host_rate_limiter_spacing():
+    """Test that requests to the same host are spaced by the minimum interval."""
+    limiter = HostRateLimiter(max_concurrent=2, min_interval=0.05)
+    starts = []
+    for _ in range(3):
+        with limiter.limit("https://www.bandsintown.com/v/1"):
+            starts.append(time.monotonic())
+    
+    assert starts[2] - starts[0] >= 0.1, "Requests should be spaced by min_interval"
+
+def test_disk_cache_lru_eviction(tmp_path):
+    """Test that the disk cache evicts least recently used entries over its size cap."""
+    cache = DiskCache(tmp_path / "cache", max_bytes=10)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    assert cache.get("a")[0] == b"12345", "Entry should be readable"
+    
+    cache.set("c", b"12345")
+    assert cache.get("b") is None, "Least recently used entry should be evicted"
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    
+    reopened = DiskCache(tmp_path / "cache", max_bytes=10)
+    assert reopened.get("c") == (b"12345", {}), "Entries should persist across instances"
+
+def test_disk_cache_journals_index_changes(monkeypatch, tmp_path):
+    """Test writes append to the index journal and are folded into index.json in batches."""
+    monkeypatch.setattr(disk_cache, "JOURNAL_COMPACT_RECORDS", 4)
+    cache = DiskCache(tmp_path / "cache", max_bytes=1024)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.delete("a")
+    
+    assert not (tmp_path / "cache" / "index.json").exists(), "Writes shouldn't rewrite the whole index"
+    assert len((tmp_path / "cache" / "index.log").read_text().splitlines()) == 3
+    assert DiskCache(tmp_path / "cache", max_bytes=1024).get("b") == (b"2", {}), "Journal should replay"
+    
+    cache.set("c", b"3")
+    assert not (tmp_path / "cache" / "index.log").exists(), "A long journal should be compacted"
+    reopened = DiskCache(tmp_path / "cache", max_bytes=1024)
+    assert reopened.get("a") is None and reopened.get("c") == (b"3", {})
+
+def test_http_cache_serves_not_modified(tmp_path):
+    """Test conditional requests are sent and 304s are served from disk."""
+    requests_seen = []
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append(self.headers.get('If-None-Match'))
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = b"<html>calendar</html>"
+            self.send_response(200)
+            self.send_header('ETag', '"v1"')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        session = requests.Session()
+        session.mount('http://', CachingHTTPAdapter(DiskCache(tmp_path / "http", max_bytes=1024)))
+        url = f"http://127.0.0.1:{server.server_port}/venue"
+        
+        first = session.get(url)
+        second = session.get(url)
+    finally:
+        server.shutdown()
+    
+    assert requests_seen == [None, '"v1"'], "Second request should be conditional"
+    assert not first.from_cache
+    assert second.from_cache, "304 should be served from the cache"
+    assert second.status_code == 200
+    assert second.text == first.text == "<html>calendar</html>"
+
+def test_venue_page_session_created_once(monkeypatch, tmp_path):
+    """Test concurrent first fetches share one cached session."""
+    class SlowAdapter(CachingHTTPAdapter):
+        def __init__(self, cache):
+            time.sleep(0.05)
+            super().__init__(cache)
+    
+    monkeypatch.setattr(venue_scraper, "_session", None)
+    monkeypatch.setattr(venue_scraper, "CachingHTTPAdapter", SlowAdapter)
+    monkeypatch.setattr(venue_scraper, "get_http_cache", lambda: DiskCache(tmp_path / "http", max_bytes=1024))
+    sessions = []
+    threads = [threading.Thread(target=lambda: sessions.append(venue_scraper._get_session())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(sessions) == 4 and all(session is sessions[0] for session in sessions)
+
+class FakeScraper:
+    """Scraper stand-in that returns a fixed event list."""
+    
+    scraper_type = "fake"
+    
+    def __init__(self, events):
+        self.events = events
+    
+    def get_events(self, venue_key, venue_info):
+        return list(self.events)
+
+def test_unchanged_events_skip_writes(monkeypatch, test_output_dir):
+    """Test that a venue whose events hash is unchanged is not rewritten."""
+    events = [
+        ArtistEvent(name="Test Artist", date=datetime.now(), venue="Test Venue"),
+        ArtistEvent(name="Another Artist", date=datetime.now(), venue="Test Venue")
+    ]
+    scraper = FakeScraper(events)
+    monkeypatch.setattr(venue_processor, "load_venue_config", lambda: {"test-venue": {"name": "Test Venue"}})
+    monkeypatch.setattr(venue_processor.ScraperFactory, "get_events_for_venue", scraper.get_events)
+    
+    first_files = process_venue("test-venue", output_dir=str(test_output_dir))
+    assert first_files, "First run should write artist files"
+    
+    writes = []
+    def fake_save(venue_key, events, month, output_dir):
+        writes.append(month)
+        return f"{output_dir}/{venue_key}/artists_{month}.yaml", True
+    monkeypatch.setattr(venue_processor, "save_artists_if_changed", fake_save)
+    second_files = process_venue("test-venue", output_dir=str(test_output_dir))
+    assert not writes, "Unchanged events should not be rewritten"
+    assert second_files == first_files, "Existing files should still be reported"
+    
+    scraper.events.append(ArtistEvent(name="New Artist", date=datetime.now(), venue="Test Venue"))
+    process_venue("test-venue", output_dir=str(test_output_dir))
+    assert writes, "Changed events should be written"
+
+def test_parallel_scrapers_merge(monkeypatch):
+    """Test that all configured scrapers run and their events are merged."""
+    day = datetime(2025, 1, 10, 20, 0)
+    results = {
+        "primary": [ArtistEvent(name="Shared Artist", date=day, venue="Test Venue")],
+        "secondary": [
+            ArtistEvent(name="shared artist", date=day, venue="Test Venue"),
+            ArtistEvent(name="Extra Artist", date=day, venue="Test Venue")
+        ]
+    }
+    
+    def fake_run_scraper(scraper_type, venue_key, venue_info):
+        if scraper_type == "primary":
+            time.sleep(0.05)  # let the secondary source answer first
+        return results[scraper_type]
+    
+    monkeypatch.setattr(ScraperFactory, "_scrapers", {"primary": FakeScraper, "secondary": FakeScraper})
+    monkeypatch.setattr(ScraperFactory, "_run_scraper", staticmethod(fake_run_scraper))
+    venue_info = {
+        "name": "Test Venue",
+        "scrapers": {
+            "secondary": {"priority": 2},
+            "primary": {"priority": 1}
+        }
+    }
+    
+    events = ScraperFactory.get_events_for_venue("test-venue", venue_info, deadline=5)
+    
+    assert [event.name for event in events] == ["Shared Artist", "Extra Artist"], "Duplicates should be merged"
+    assert events[0].scraper_type == "primary", "Higher-priority copy should win"
+    assert events[1].scraper_type == "secondary"
+
+def test_stream_text_engine_matches_bs4():
+    """Test the streaming text engine produces the same text as BeautifulSoup."""
+    html = """<html><head><title>Shows &amp; Events</title>
+    <style>.event { color: red; }</style><script>var events = '<p>';</script></head>
+    <body>
+      <div class="event"><h3>Test Artist</h3>  <span>Jan&nbsp;10</span></div>
+      <!-- comment -->
+      <p>Another Artist &#150; Feb 2 &foo;<br/>
+      <pre>  keep   spacing  </pre><template><p>hidden</p></template>
+      <p>unclosed <div>text</p> tail
+    </body></html>"""
+    
+    assert extract_text(html, 'stream') == extract_text(html, 'bs4')
+    assert "var events" not in clean_calendar_text(html), "Script content should be removed"
+    assert "Test Artist" in clean_calendar_text(html)
+
+class FakeCompletions:
+    """Stand-in for the OpenAI chat completions API."""
+    
+    def __init__(self, content):
+        self.content = content
+        self.calls = 0
+    
+    def create(self, messages, model):
+        self.calls += 1
+        message = type("Message", (), {"content": self.content})
+        choice = type("Choice", (), {"message": message})
+        return type("Completion", (), {"choices": [choice]})
+
+def test_llm_cache_persists_across_extractors(monkeypatch, tmp_path):
+    """Test identical chunks are answered from the on-disk cache across instances."""
+    completions = FakeCompletions("Test Artist | 2025-01-10")
+    fake_client = type("Client", (), {"chat": type("Chat", (), {"completions": completions})})
+    monkeypatch.setattr(openai_extractor, "OpenAI", lambda api_key: fake_client)
+    
+    def make_extractor():
+        return ArtistExtractor(cache=DiskCache(tmp_path / "llm", max_bytes=1024 * 1024, ttl=3600))
+    
+    first = make_extractor().extract_artists_from_text("Test Artist plays Jan 10")
+    second = make_extractor().extract_artists_from_text("Test Artist plays Jan 10")
+    
+    assert completions.calls == 1, "Second extraction should be served from the cache"
+    assert [event.name for event in first] == [event.name for event in second] == ["Test Artist"]
+    
+    make_extractor().extract_artists_from_text("A different chunk")
+    assert completions.calls == 2, "Different chunks should not share a cache entry"
+
+def test_token_rate_limiter_budget():
+    """Test that requests beyond the per-window budget wait for the window to slide."""
+    limiter = TokenRateLimiter(requests_per_minute=10, tokens_per_minute=100, window=0.1)
+    start = time.monotonic()
+    limiter.acquire(60)
+    limiter.acquire(60)  # over the token budget until the first request leaves the window
+    assert time.monotonic() - start >= 0.1, "Second request should wait for the token budget"
+
+def test_concurrent_chunks_keep_order(monkeypatch, tmp_path):
+    """Test that concurrently processed chunks come back in chunk order."""
+    class SlowCompletions:
+        def create(self, messages, model):
+            chunk = messages[0]["content"].rsplit(": ", 1)[-1]
+            time.sleep(0.05 if chunk == "first" else 0)
+            message = type("Message", (), {"content": f"{chunk} artist | 2025-01-10"})
+            return type("Completion", (), {"choices": [type("Choice", (), {"message": message})]})
+    
+    fake_client = type("Client", (), {"chat": type("Chat", (), {"completions": SlowCompletions()})})
+    monkeypatch.setattr(openai_extractor, "OpenAI", lambda api_key: fake_client)
+    extractor = ArtistExtractor(
+        cache=DiskCache(tmp_path / "llm", max_bytes=1024 * 1024),
+        max_concurrency=3,
+        limiter=TokenRateLimiter(requests_per_minute=100, tokens_per_minute=100000)
+    )
+    
+    events = extractor.process_chunks(["first", "second", "third"])
+    assert [event.name for event in events] == ["first artist", "second artist", "third artist"]
+
+class WordEncoding:
+    """Fake tiktoken encoding where every word is one token."""
+    
+    def encode(self, text, disallowed_special=()):
+        return [match.start() for match in re.finditer(r'\S+', text)]
+    
+    def decode_with_offsets(self, tokens):
+        return None, tokens
+
+def test_chunk_message_token_budget(monkeypatch):
+    """Test token-budgeted chunking packs whole sentences up to the budget."""
+    monkeypatch.setattr(text_utils, "get_encoding", lambda model: WordEncoding())
+    text = "One two three. Four five six. Seven eight nine ten eleven."
+    
+    chunks = chunk_message(text, max_tokens=7)
+    
+    assert chunks == ["One two three. Four five six.", "Seven eight nine ten eleven."]
+    assert all(len(chunk.split()) <= 7 for chunk in chunks), "Chunks should fit the token budget"
+
+def test_chunk_message_prefers_sentence_breaks():
+    """Test character-budgeted chunking breaks at sentences and keeps all text."""
+    text = "Hello world. This is a test! Another sentence? yes " * 200
+    
+    chunks = chunk_message(text, max_length=50)
+    
+    assert all(len(chunk) <= 50 for chunk in chunks), "Chunks should respect max_length"
+    assert chunks[0] == "Hello world. This is a test! Another sentence?", "Should break at the last sentence end"
+    assert "".join("".join(chunks).split()) == "".join(text.split()), "No text should be lost"
+
+class FakeLLMExtractor:
+    """Records chunks the rules gave up on."""
+    
+    def __init__(self):
+        self.chunks = []
+    
+    def process_chunks(self, chunks):
+        self.chunks.extend(chunks)
+        return [ArtistEvent(name="Model Artist", date=datetime(2026, 12, 24), venue="")]
+
+def test_rule_extractor_skips_llm_for_listings():
+    """Test calendar listings are parsed locally and only unclear text reaches the LLM."""
+    rules = RuleBasedExtractor(today=date(2026, 10, 17))
+    llm = FakeLLMExtractor()
+    extractor = CalendarEventExtractor(rules=rules, llm_extractor=llm)
+    text = ("Upcoming Events\n"
+            "The Growlers | Oct 24\n"
+            "Fri, Nov 7 - Japanese Breakfast 8:00 PM\n"
+            "Sat Jan 3\n"
+            "Khruangbin\n"
+            "Buy Tickets\n")
+    
+    events = extractor.extract(text, "Test Venue")
+    
+    assert [(e.name, e.date.strftime('%Y-%m-%d')) for e in events] == [
+        ("The Growlers", "2026-10-24"),
+        ("Japanese Breakfast", "2026-11-07"),
+        ("Khruangbin", "2027-01-03"),
+    ], "Past month-days without a year should roll over to next year"
+    assert all(e.venue == "Test Venue" for e in events)
+    assert llm.chunks == [], "Confidently parsed chunks should not be sent to the LLM"
+    
+    prose = "Join us Dec 24 and Dec 31 for two nights of surprises with friends from all over town."
+    events = extractor.extract(prose, "Test Venue")
+    assert llm.chunks == [prose], "Unparsed dated text should fall back to the LLM"
+    assert [e.name for e in events] == ["Model Artist"]
+
+    for notice in ("Tickets on sale Nov 1\nBig Thief",
+                   "Half price drinks 1/2 off",
+                   "Closed for Thanksgiving Nov 27"):
+        assert rules.extract(notice) == ([], False), f"Venue notice parsed as a show: {notice!r}"
+    
+    names = "Margo Price | Nov 7\nThe Specials Nov 8\nHoliday Nov 9\nOff! - Nov 10\nDrinks Nov 11"
+    events, confident = rules.extract(names)
+    assert [e.name for e in events] == ["Margo Price", "The Specials", "Holiday", "Off!", "Drinks"]
+    assert confident, "Names sharing words with venue notices are still artists"
+
+def test_chunk_filter_drops_boilerplate_and_repeats():
+    """Test boilerplate, dateless and repeated chunks never reach the extractors."""
+    counter = PageLineCounter()
+    page = "Skip to content\nHome\nBuy Tickets\nThe Growlers | Oct 24\n© 2026 Test Venue\nPrivacy Policy"
+    assert strip_boilerplate(page, counter) == "Home\nThe Growlers | Oct 24", "A one-off menu word may be a band"
+    assert strip_boilerplate("Home\nMerch\nBig Thief | Nov 1", counter) == "Merch\nBig Thief | Nov 1", \
+        "Menu words repeated across pages are navigation"
+    listings = "Cookie Monsta | Dec 2\nFollow Us Down | Dec 3\nPowered By Robots | Dec 4"
+    banners = "\nWe use cookies to improve your experience.\nFollow us on Instagram"
+    assert strip_boilerplate(listings + banners, counter) == listings
+    
+    listing = " ".join(f"Artist {i} plays live with special guests on Nov {i}" for i in range(1, 8))
+    next_night = listing.replace("Nov 7", "Nov 8")
+    chunks = [listing, next_night, listing, "Big Thief | Dec 1", "Khruangbin",
+              "About the venue", "Sign up for our mailing list and follow along"]
+    
+    assert ChunkFilter().filter(chunks) == [listing, next_night, "Big Thief | Dec 1", "Khruangbin"], \
+        "Exact repeats and far dateless text go; other nights of a run and text beside a date stay"
+
+def test_artist_event_slots_and_interning():
+    """Test events are slotted, share venue strings and bulk-build like validated ones."""
+    date = datetime(2026, 11, 7)
+    venue = "".join(["Test ", "Venue"])  # built at runtime so it isn't a literal constant
+    
+    events = ArtistEvent.bulk([("Artist A", date), ("Artist B", date)], venue, "bandisintown")
+    
+    assert not hasattr(events[0], "__dict__"), "Events should not carry a per-instance dict"
+    assert events[0].venue is events[1].venue, "Venue strings should be shared"
+    assert events[0] == ArtistEvent(name=" Artist A ", date="2026-11-07", venue="Test Venue",
+                                    scraper_type="bandisintown")
+    
+    events[0].venue = "".join(["Other ", "Venue"])
+    assert events[0].venue is ArtistEvent.from_trusted("Artist C", date, "Other Venue").venue
+
+def test_event_index_buckets_by_year_and_window():
+    """Test events bucket by (year, month) and answer date-window queries."""
+    events = [
+        ArtistEvent(name="Next January", date=datetime(2027, 1, 9), venue="Test Venue"),
+        ArtistEvent(name="This Week", date=datetime(2026, 10, 20), venue="Test Venue"),
+        ArtistEvent(name="Later", date=datetime(2026, 10, 30), venue="Test Venue"),
+        ArtistEvent(name="This Week", date=datetime(2026, 10, 22), venue="Test Venue"),
+        ArtistEvent(name="Last January", date=datetime(2026, 1, 9), venue="Test Venue"),
+    ]
+    
+    index = EventIndex(events)
+    
+    assert [e.name for e in index.month(*parse_month("January_2027"))] == ["Next January"]
+    assert [e.name for e in index.unique_month(2026, 10)] == ["This Week", "Later"]
+    assert index.months() == [(2026, 1), (2026, 10), (2027, 1)]
+    assert [e.name for e in index.next_days(7, now=datetime(2026, 10, 17, 15))] == ["This Week", "This Week"]
+    assert len(index.between(datetime(2026, 10, 1), datetime(2027, 1, 9))) == 3
+    
+    halloween = datetime.fromisoformat("2026-10-31T20:00-07:00")
+    aware = EventIndex([ArtistEvent(name="Halloween", date=halloween, venue="Test Venue")])
+    assert aware.months() == [(2026, 10)], "Aware dates should bucket by the venue's local wall clock"
+
+def test_event_store_roundtrip_and_freshness(monkeypatch, tmp_path, test_output_dir):
+    """Test the SQLite store mirrors artist lists, answers freshness and exports YAML."""
+    store = EventStore(str(tmp_path / "venues.db"))
+    monkeypatch.setattr(storage, "get_event_store", lambda: store)
+    city = city_from_path(test_output_dir)
+    events = [ArtistEvent(name=name, date=datetime(2026, 11, 7), venue="Test Venue") for name in ("B", "A", "B")]
+    
+    save_artists_to_file("test_venue", events, "November_2026", test_output_dir)
+    store.replace_events(city, "test_venue", events)
+    
+    assert store.venue_artists(city, "test_venue", "November_2026") == ["B", "A"]
+    assert store.artists_for_month(city, "November_2026") == {"test_venue": ["B", "A"]}
+    assert storage.needs_update("test_venue", "November_2026", test_output_dir), "No playlist yet"
+    
+    store.save_playlist(city, "test_venue", "November_2026", "https://open.spotify.com/playlist/x",
+                        datetime.now().isoformat())
+    assert not storage.needs_update("test_venue", "November_2026", test_output_dir), "Fresh playlist"
+    
+    exported = store.export_yaml(str(tmp_path / "export"))
+    with open(tmp_path / "export" / city / "test_venue" / "artists_November_2026.yaml") as f:
+        assert yaml.safe_load(f)["artists"] == ["B", "A"]
+    assert len(exported) == 2
+    store.close()
+
+def test_yaml_snapshot_cache_skips_reparsing(monkeypatch, tmp_path):
+    """Test unchanged YAML files load from snapshots, in memory and across runs."""
+    path = tmp_path / "artists.yaml"
+    path.write_text("artists:\n- A\n- B\n")
+    disk = DiskCache(tmp_path / "snapshots", max_bytes=1024 * 1024)
+    parses = []
+    real_load = yaml.load
+    monkeypatch.setattr(yaml_cache.yaml, "load", lambda f, Loader: parses.append(1) or real_load(f, Loader=Loader))
+    
+    first = YAMLSnapshotCache(disk).load(path)
+    first["artists"].append("mutated")
+    assert YAMLSnapshotCache(disk).load(path) == {"artists": ["A", "B"]}, "New run should reuse the disk snapshot"
+    cache = YAMLSnapshotCache(disk)
+    cache.load(path)
+    assert cache.load(path) == {"artists": ["A", "B"]}
+    assert len(parses) == 1, "Unchanged file should be parsed once"
+    
+    path.write_text("artists:\n- C\n")
+    assert cache.load(path) == {"artists": ["C"]}, "Changed file should be reparsed"
+    
+    stat = path.stat()
+    path.write_text("artists:\n- D\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cache.load(path) == {"artists": ["D"]}, "Same-size rewrite keeping the mtime should be reparsed"
+
+def test_unchanged_artists_keep_file_untouched(test_output_dir):
+    """Test saving identical artists leaves the file, its timestamp and mtime alone."""
+    events = [ArtistEvent(name="Artist A", date=datetime(2026, 11, 7), venue="Test Venue")]
+    
+    filename, changed = storage.save_artists_if_changed("test_venue", events, "November_2026", test_output_dir)
+    assert changed
+    mtime = Path(filename).stat().st_mtime_ns
+    with open(filename) as f:
+        updated = yaml.safe_load(f)["updated"]
+    
+    _, changed = storage.save_artists_if_changed("test_venue", events, "November_2026", test_output_dir)
+    assert not changed, "Identical artists should not count as a change"
+    assert Path(filename).stat().st_mtime_ns == mtime
+    with open(filename) as f:
+        assert yaml.safe_load(f)["updated"] == updated
+    
+    events.append(ArtistEvent(name="Artist B", date=datetime(2026, 11, 8), venue="Test Venue"))
+    _, changed = storage.save_artists_if_changed("test_venue", events, "November_2026", test_output_dir)
+    assert changed
+    assert not list(Path(filename).parent.glob("*.tmp")), "No temp files should be left behind"
+
+def test_manifest_tracks_freshness(test_output_dir):
+    """Test storage writers keep the city manifest that needs_update and plan read."""
+    events = [ArtistEvent(name="Artist A", date=datetime(2026, 11, 7), venue="Test Venue")]
+    storage.save_artists_to_file("test_venue", events, "November_2026", test_output_dir)
+    
+    assert manifest.plan(test_output_dir, ["test_venue"], ["November_2026"]) == [
+        ("test_venue", "November_2026", "no playlist yet")
+    ]
+    
+    manifest.record_playlist(test_output_dir, "test_venue", "November_2026", "https://example.com/p",
+                             datetime.now().isoformat())
+    assert manifest.plan(test_output_dir, ["test_venue"], ["November_2026"]) == []
+    assert not storage.needs_update("test_venue", "November_2026", test_output_dir)
+    
+    events.append(ArtistEvent(name="Artist B", date=datetime(2026, 11, 8), venue="Test Venue"))
+    storage.save_artists_to_file("test_venue", events, "November_2026", test_output_dir)
+    assert manifest.plan(test_output_dir, ["test_venue"], ["November_2026"]) == [
+        ("test_venue", "November_2026", "artists changed since playlist")
+    ]
+    assert storage.needs_update("test_venue", "November_2026", test_output_dir)
+
+def test_needs_update_seeds_manifest_from_existing_files(test_output_dir):
+    """Test venue-months saved before the manifest existed are judged by their YAML, then recorded."""
+    venue_dir = Path(test_output_dir) / "test_venue"
+    venue_dir.mkdir(parents=True)
+    now = datetime.now()
+    for month, artists_age in (("November_2026", 3), ("December_2026", 1)):
+        (venue_dir / f"artists_{month}.yaml").write_text(yaml.safe_dump(
+            {"venue": "test_venue", "month": month, "artists": ["A"],
+             "updated": (now - timedelta(hours=artists_age)).isoformat()}))
+        (venue_dir / f"playlist_{month}.yaml").write_text(yaml.safe_dump(
+            {"venue": "test_venue", "month": month, "playlist_url": "https://example.com/p",
+             "created": (now - timedelta(hours=2)).isoformat()}))
+    # Files copied or checked out later, so their mtimes say nothing about freshness
+    old = (now - timedelta(days=3)).timestamp()
+    for path in venue_dir.iterdir():
+        os.utime(path, (old, old))
+    
+    assert not storage.needs_update("test_venue", "November_2026", test_output_dir), "Playlist built after artists"
+    assert storage.needs_update("test_venue", "December_2026", test_output_dir), "Artists changed after playlist"
+    assert manifest.plan(test_output_dir, ["test_venue"], ["November_2026", "December_2026"]) == [
+        ("test_venue", "December_2026", "artists changed since playlist")
+    ], "Seeded entries should be recorded in the manifest"
+
+class FakePlaylistAccount:
+    """Offset-paged playlist listing whose first unfollow is rate limited; unfollowing removes from the listing."""
+    
+    def __init__(self, playlists):
+        self.playlists = playlists
+        self.unfollowed = []
+        self.throttled = False
+        self.lock = threading.Lock()
+    
+    def _page(self, offset, limit):
+        more = offset + limit < len(self.playlists)
+        return {'items': self.playlists[offset:offset + limit], 'offset': offset, 'limit': limit,
+                'next': "next" if more else None}
+    
+    def current_user_playlists(self, limit=50):
+        return self._page(0, limit)
+    
+    def next(self, page):
+        return self._page(page['offset'] + page['limit'], page['limit'])
+    
+    def current_user_unfollow_playlist(self, playlist_id):
+        with self.lock:
+            if not self.throttled:
+                self.throttled = True
+                raise SpotifyException(429, -1, "rate limited", headers={'Retry-After': '0.1'})
+            self.unfollowed.append(playlist_id)
+            self.playlists = [playlist for playlist in self.playlists if playlist['id'] != playlist_id]
+
+def test_playlist_cleanup_pages_and_retries():
+    """Test cleanup reads every page, retries rate-limited unfollows and supports dry runs."""
+    old = (datetime.now() - timedelta(days=2)).isoformat()
+    playlists = [
+        {'id': f"p{i}", 'name': f"[TEST] Venue {i}" if i % 2 else f"Venue {i}", 'description': f"Created: {old}"}
+        for i in range(120)
+    ]
+    account = FakePlaylistAccount(playlists)
+    cleaner = PlaylistCleaner(spotify_client=account, max_concurrency=4)
+    
+    would_clean = cleaner.cleanup_test_playlists(dry_run=True)
+    assert len(would_clean) == 60, "Test playlists past the first page should be found"
+    assert account.unfollowed == [], "Dry run should not delete anything"
+    
+    cleaned = cleaner.cleanup_test_playlists()
+    assert sorted(cleaned) == sorted(would_clean)
+    assert sorted(account.unfollowed) == sorted(would_clean), "Rate-limited unfollow should be retried"
+    assert not any(p['name'].startswith("[TEST]") for p in account.playlists), "No test playlist should be skipped"
+    assert len(account.playlists) == 60
@@ -1,20 +1,26 @@
-from venue_data.venue_processor import process_venue
+from venue_data.collector import collect_venues, DEFAULT_WORKERS
+from venue_data.rate_limit import DEFAULT_MAX_PER_HOST
 from venue_data.config import VENUES
+from venue_data.scraper_factory import ScraperFactory
 import argparse
 
-def update_all(city: str = "sf", force_venue: str = None, force_all: bool = False):
-    # Process each venue
-    for venue_key in VENUES:
-        if force_venue and venue_key != force_venue:
-            continue
-            
-        print(f"Processing venue: {venue_key}")
-        process_venue(venue_key, force=force_all)
+def update_all(city: str = "sf", force_venue: str = None, force_all: bool = False,
+               workers: int = DEFAULT_WORKERS, max_per_host: int = DEFAULT_MAX_PER_HOST):
+    venue_keys = [venue_key for venue_key in VENUES if not force_venue or venue_key == force_venue]
+    
+    # Process venues concurrently
+    try:
+        print(f"Processing venues: {', '.join(venue_keys)}")
+        return collect_venues(venue_keys, force=force_all, max_workers=workers, max_per_host=max_per_host)
+    finally:
+        ScraperFactory.shutdown()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--force", help="Force update for specific venue key")
     parser.add_argument("--force-all", action="store_true", help="Force update all venues")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of venues to collect concurrently")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_MAX_PER_HOST, help="Maximum concurrent requests per host")
     args = parser.parse_args()
     
-    update_all(force_venue=args.force, force_all=args.force_all) 
\ No newline at end of file
+    update_all(force_venue=args.force, force_all=args.force_all, workers=args.workers, max_per_host=args.per_host) 
\ No newline at end of file
@@ -1,8 +1,11 @@
 import logging
-from typing import List
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 import openai
 from .models import ArtistEvent
-from .constants import MESSAGE_PREFIX
+from .constants import MESSAGE_PREFIX, RESPONSE_TOKEN_ESTIMATE
+from .rate_limit import TokenRateLimiter, get_openai_limiter, OPENAI_MAX_CONCURRENCY
+from .text_utils import count_tokens
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -10,31 +13,44 @@ logger = logging.getLogger(__name__)
 class ArtistExtractor:
     """Extract artist events from text using OpenAI."""
     
+    def __init__(self, max_concurrency: int = OPENAI_MAX_CONCURRENCY, limiter: Optional[TokenRateLimiter] = None):
+        self.max_concurrency = max_concurrency
+        self.limiter = limiter or get_openai_limiter()
+    
     def process_chunks(self, text_chunks: List[str]) -> List[ArtistEvent]:
-        """Process text chunks and extract artist events."""
+        """Process text chunks concurrently and extract artist events in chunk order."""
         events = []
-        for chunk in text_chunks:
-            try:
-                # Format message for OpenAI
-                message = MESSAGE_PREFIX + chunk
-                
-                # Get response from OpenAI
-                response = openai.ChatCompletion.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": message}],
-                    temperature=0
-                )
-                
-                # Parse response
-                text = response.choices[0].message.content
-                events.extend(self._parse_events(text))
-                
-            except Exception as e:
-                logger.error(f"Error processing chunk: {e}")
-                continue
+        if not text_chunks:
+            return events
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(text_chunks))) as executor:
+            for chunk_events in executor.map(self._process_chunk, text_chunks):
+                events.extend(chunk_events)
         
         return events
     
+    def _process_chunk(self, chunk: str) -> List[ArtistEvent]:
+        """Extract artist events from a single chunk."""
+        try:
+            # Format message for OpenAI
+            message = MESSAGE_PREFIX + chunk
+            self.limiter.acquire(count_tokens(message) + RESPONSE_TOKEN_ESTIMATE)
+            
+            # Get response from OpenAI
+            response = openai.ChatCompletion.create(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": message}],
+                temperature=0
+            )
+            
+            # Parse response
+            text = response.choices[0].message.content
+            return self._parse_events(text)
+            
+        except Exception as e:
+            logger.error(f"Error processing chunk: {e}")
+            return []
+    
     def _parse_events(self, text: str) -> List[ArtistEvent]:
         """Parse events from OpenAI response."""
         events = []
@@ -0,0 +1,188 @@
+import re
+import zlib
+import logging
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from .rule_extractor import DATE_PATTERNS, MONTHS
+
+logger = logging.getLogger(__name__)
+
+# Navigation, footer and ticketing phrases that never name an act
+BOILERPLATE_PATTERNS = re.compile(
+    r'^(?:skip\s+to\s+(?:main\s+)?content|about\s+us|contact\s+us|'
+    r'log\s*in|sign\s*(?:in|up)|my\s+account|'
+    r'(?:buy|get)\s+tickets?|more\s+info|sold\s*out|'
+    r'privacy\s+policy|terms\s+(?:of\s+(?:service|use)|&\s+conditions)|'
+    r'cookie\s+(?:policy|settings|preferences)|(?:we\s+use|this\s+(?:web)?site\s+uses)\s+cookies\b[^|]*|'
+    r'(?:subscribe|sign\s+up|join)\s+(?:to\s+|for\s+)?(?:our|the)\s+(?:newsletter|mailing\s+list)[^|]*|'
+    r'follow\s+us(?:\s+on\s+(?:facebook|instagram|twitter|tiktok|youtube|social(?:\s+media)?))?[!.:]?|'
+    r'(?:©|\(c\)|copyright\s+(?:©\s*)?\d{4})[^|]*|all\s+rights\s+reserved\.?|'
+    r'(?:(?:web)?site\s+)?powered\s+by\s+(?:wordpress|squarespace|wix|shopify|eventbrite|ticketmaster|'
+    r'dice|see\s+tickets|etix|axs|tixr)\.?)$',
+    re.IGNORECASE
+)
+
+# Single-word menu entries; bands use these names too, so they're only
+# stripped once the same line has appeared on another page
+NAV_WORD_PATTERN = re.compile(
+    r'^(?:menu|home|about|contact|faq|search|cart|shop|merch|tickets?|rsvp|privacy|terms|accessibility|'
+    r'newsletter|share|facebook|instagram|twitter|tiktok|youtube|spotify)$',
+    re.IGNORECASE
+)
+
+class PageLineCounter:
+    """Remembers which navigation-word lines have appeared on earlier pages."""
+
+    def __init__(self):
+        self._seen: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def repeated(self, lines: Iterable[str]) -> Set[str]:
+        """Return the lines already seen on another page, then record these for later pages."""
+        keys = {line.casefold() for line in lines}
+        with self._lock:
+            repeated = keys & self._seen
+            self._seen |= keys
+        return repeated
+
+_shared_counter: Optional[PageLineCounter] = None
+_shared_counter_lock = threading.Lock()
+
+def get_page_line_counter() -> PageLineCounter:
+    """Return the process-wide page line counter."""
+    global _shared_counter
+    with _shared_counter_lock:
+        if _shared_counter is None:
+            _shared_counter = PageLineCounter()
+        return _shared_counter
+
+# Words per shingle and MinHash signature layout (bands * rows hashes)
+SHINGLE_SIZE = 5
+MINHASH_BANDS = 16
+MINHASH_ROWS = 4
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+def _hash_params(count: int) -> List[Tuple[int, int]]:
+    """Fixed (a, b) pairs for the universal hashes, so signatures are stable across runs."""
+    params = []
+    seed = 0x9E3779B9
+    for _ in range(count):
+        seed = (seed * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        a = seed % _MERSENNE_PRIME or 1
+        seed = (seed * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        params.append((a, seed % _MERSENNE_PRIME))
+    return params
+
+_HASH_PARAMS = _hash_params(MINHASH_BANDS * MINHASH_ROWS)
+
+def strip_boilerplate(text: str, counter: Optional[PageLineCounter] = None) -> str:
+    """Drop navigation/footer/ticketing lines and collapse the blank lines left behind.
+
+    Single-word menu entries are only dropped when ``counter`` has seen them on
+    another page; a one-off "Merch" or "Home" line may be a band.
+    """
+    page = [line.strip() for line in text.splitlines()]
+    repeated = (counter or get_page_line_counter()).repeated(
+        line for line in page if NAV_WORD_PATTERN.match(line)
+    )
+
+    lines = []
+    for stripped in page:
+        if not stripped:
+            if lines and lines[-1]:
+                lines.append('')
+            continue
+        if BOILERPLATE_PATTERNS.match(stripped) or stripped.casefold() in repeated:
+            continue
+        lines.append(stripped)
+    return '\n'.join(lines).strip()
+
+def has_event_date(text: str) -> bool:
+    """Whether text mentions anything that looks like an event date."""
+    return any(pattern.search(text) for pattern in DATE_PATTERNS)
+
+def event_dates(text: str) -> FrozenSet[Tuple[str, int, int]]:
+    """The (year or '', month, day) of every date mentioned in text."""
+    dates = set()
+    for pattern in DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            groups = match.groupdict()
+            month = groups.get('month') or groups.get('month2')
+            day = groups.get('day') or groups.get('day2')
+            month = int(month) if month.isdigit() else MONTHS[month.lower()]
+            dates.add((groups.get('year') or '', month, int(day)))
+    return frozenset(dates)
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hashed word n-grams of case-folded text."""
+    words = text.casefold().split()
+    if len(words) <= size:
+        return {zlib.crc32(' '.join(words).encode('utf-8'))}
+    return {zlib.crc32(' '.join(words[i:i + size]).encode('utf-8')) for i in range(len(words) - size + 1)}
+
+def minhash(shingle_set: Set[int]) -> Tuple[int, ...]:
+    """MinHash signature approximating Jaccard similarity between shingle sets."""
+    return tuple(
+        min(((a * s + b) % _MERSENNE_PRIME) & _MAX_HASH for s in shingle_set)
+        for a, b in _HASH_PARAMS
+    )
+
+def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+class ChunkFilter:
+    """Drop chunks that carry no event dates or repeat a chunk already kept.
+
+    Candidates are found with MinHash locality-sensitive hashing, so each chunk
+    is only compared against kept chunks that share a signature band. A
+    near-duplicate is only dropped when it also mentions the same dates, so
+    the nights of a residency or multi-night run all survive. A dateless chunk
+    is kept when it borders a dated one, since a listing's date and artist
+    lines can fall on either side of a chunk boundary.
+    """
+
+    def __init__(self, threshold: float = 0.8):
+        self.threshold = threshold
+        self._signatures: List[Tuple[int, ...]] = []
+        self._dates: List[FrozenSet[Tuple[str, int, int]]] = []
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+    def is_duplicate(self, chunk: str) -> bool:
+        """Check a chunk against those seen so far, remembering it if it's new."""
+        signature = minhash(shingles(chunk))
+        dates = event_dates(chunk)
+        bands = [
+            (band, signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS])
+            for band in range(MINHASH_BANDS)
+        ]
+
+        candidates = {i for key in bands for i in self._buckets.get(key, ())}
+        if any(self._dates[i] == dates and similarity(signature, self._signatures[i]) >= self.threshold
+               for i in candidates):
+            return True
+
+        index = len(self._signatures)
+        self._signatures.append(signature)
+        self._dates.append(dates)
+        for key in bands:
+            self._buckets.setdefault(key, []).append(index)
+        return False
+
+    def filter(self, chunks: Iterable[str]) -> List[str]:
+        """Return the event-bearing, non-duplicate chunks in order."""
+        chunks = [chunk for chunk in chunks if chunk.strip()]
+        dated = [has_event_date(chunk) for chunk in chunks]
+        kept = []
+        dropped = 0
+        for i, chunk in enumerate(chunks):
+            near_date = dated[i] or (i > 0 and dated[i - 1]) or (i + 1 < len(chunks) and dated[i + 1])
+            if not near_date or self.is_duplicate(chunk):
+                dropped += 1
+                continue
+            kept.append(chunk)
+        if dropped:
+            logger.info(f"Dropped {dropped} chunks without events or repeating earlier text")
+        return kept
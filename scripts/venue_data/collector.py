@@ -0,0 +1,40 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+from .venue_processor import process_venue
+from .storage import load_venue_config
+from .rate_limit import configure_host_limiter, DEFAULT_MAX_PER_HOST, DEFAULT_MIN_INTERVAL
+from .scrapers.driver_pool import get_driver_pool
+
+logger = logging.getLogger(__name__)
+
+# Number of venues collected at the same time
+DEFAULT_WORKERS = 4
+
+def collect_venues(venue_keys: Iterable[str], output_dir: str = "data/venue-data/sf", force: bool = False,
+                   max_workers: int = DEFAULT_WORKERS, max_per_host: int = DEFAULT_MAX_PER_HOST,
+                   min_interval: float = DEFAULT_MIN_INTERVAL,
+                   changed: Optional[Dict[str, List[str]]] = None) -> Dict[str, List[str]]:
+    """Process venues concurrently, returning each venue's output files in input order.
+
+    A venue that fails maps to an empty list, exactly as process_venue reports it.
+    If ``changed`` is given, it is filled with the months each venue actually rewrote.
+    """
+    venue_keys = list(venue_keys)
+    venues = load_venue_config()
+    configure_host_limiter(max_per_host, min_interval)
+    get_driver_pool().resize(max_workers)
+
+    def run(venue_key: str) -> List[str]:
+        changed_months = changed.setdefault(venue_key, []) if changed is not None else None
+        try:
+            return process_venue(venue_key, output_dir=output_dir, force=force, venues=venues,
+                                 changed_months=changed_months)
+        except Exception as e:
+            logger.error(f"Error processing venue {venue_key}: {str(e)}")
+            return []
+
+    logger.info(f"Collecting {len(venue_keys)} venues with {max_workers} workers")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(run, venue_keys)
+        return dict(zip(venue_keys, results))
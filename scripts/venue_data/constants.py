@@ -1,3 +1,14 @@
 MESSAGE_PREFIX = """Extract artist names and their performance dates from this text.
 Format each line as: 'Artist Name | MMM DD' (e.g. 'Band Name | NOV 09')
 If no specific date is found, skip that artist. Text to process: """
+
+# HTTP request headers
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Seconds to wait for a venue page over plain HTTP
+HTTP_TIMEOUT = 10
+
+# Completion tokens budgeted per OpenAI request when rate limiting
+RESPONSE_TOKEN_ESTIMATE = 256
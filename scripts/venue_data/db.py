@@ -0,0 +1,228 @@
+import os
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import yaml
+from .models import ArtistEvent
+
+logger = logging.getLogger(__name__)
+
+# SQLite file mirroring the YAML venue data; unset keeps YAML as the only store
+VENUE_DB = os.environ.get('VENUE_DB')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS venues (
+    city TEXT NOT NULL,
+    venue_key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (city, venue_key)
+);
+CREATE TABLE IF NOT EXISTS events (
+    city TEXT NOT NULL,
+    venue_key TEXT NOT NULL,
+    month TEXT NOT NULL,
+    artist TEXT NOT NULL,
+    date TEXT NOT NULL,
+    scraper_type TEXT,
+    PRIMARY KEY (city, venue_key, artist, date)
+);
+CREATE INDEX IF NOT EXISTS events_by_month ON events (city, month, venue_key);
+CREATE TABLE IF NOT EXISTS artists (
+    city TEXT NOT NULL,
+    venue_key TEXT NOT NULL,
+    month TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    artist TEXT NOT NULL,
+    PRIMARY KEY (city, venue_key, month, position)
+);
+CREATE INDEX IF NOT EXISTS artists_by_month ON artists (city, month);
+CREATE TABLE IF NOT EXISTS artist_lists (
+    city TEXT NOT NULL,
+    venue_key TEXT NOT NULL,
+    month TEXT NOT NULL,
+    updated TEXT NOT NULL,
+    PRIMARY KEY (city, venue_key, month)
+);
+CREATE TABLE IF NOT EXISTS playlists (
+    city TEXT NOT NULL,
+    venue_key TEXT NOT NULL,
+    month TEXT NOT NULL,
+    playlist_url TEXT NOT NULL,
+    created TEXT NOT NULL,
+    PRIMARY KEY (city, venue_key, month)
+);
+CREATE INDEX IF NOT EXISTS playlists_by_month ON playlists (city, month);
+"""
+
+def city_from_path(output_dir: str) -> str:
+    """City key of a 'data/venue-data/{city}' directory."""
+    return Path(output_dir).name
+
+class EventStore:
+    """SQLite store for venues, events, monthly artist lists and playlists.
+
+    Rows are keyed by city, venue and 'Month_YYYY' month, so freshness checks
+    and per-month artist queries are single indexed lookups. Writes run in
+    transactions and replace a venue-month's rows as a whole.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Shared across collector threads; the lock serializes access
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def upsert_venues(self, city: str, venues: Dict[str, dict]) -> None:
+        """Insert or update venue names and descriptions from a venues.yaml mapping."""
+        rows = [(city, key, info['name'], info.get('description', '')) for key, info in venues.items()]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO venues (city, venue_key, name, description) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (city, venue_key) DO UPDATE SET name = excluded.name, description = excluded.description",
+                rows
+            )
+
+    def replace_events(self, city: str, venue_key: str, events: Iterable[ArtistEvent]) -> None:
+        """Replace a venue's stored events with a freshly scraped set."""
+        rows = {
+            (city, venue_key, event.date.strftime('%B_%Y'), event.name, event.date.isoformat(), event.scraper_type)
+            for event in events
+        }
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM events WHERE city = ? AND venue_key = ?", (city, venue_key))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO events (city, venue_key, month, artist, date, scraper_type) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def save_artists(self, city: str, venue_key: str, month: str, artists: List[str], updated: str) -> None:
+        """Replace a venue's artist list for a month."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM artists WHERE city = ? AND venue_key = ? AND month = ?", (city, venue_key, month)
+            )
+            self._conn.executemany(
+                "INSERT INTO artists (city, venue_key, month, position, artist) VALUES (?, ?, ?, ?, ?)",
+                [(city, venue_key, month, position, artist) for position, artist in enumerate(artists)]
+            )
+            self._conn.execute(
+                "INSERT INTO artist_lists (city, venue_key, month, updated) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (city, venue_key, month) DO UPDATE SET updated = excluded.updated",
+                (city, venue_key, month, updated)
+            )
+
+    def save_playlist(self, city: str, venue_key: str, month: str, playlist_url: str, created: str) -> None:
+        """Insert or update a venue's playlist for a month."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO playlists (city, venue_key, month, playlist_url, created) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (city, venue_key, month) DO UPDATE SET "
+                "playlist_url = excluded.playlist_url, created = excluded.created",
+                (city, venue_key, month, playlist_url, created)
+            )
+
+    def venue_artists(self, city: str, venue_key: str, month: str) -> Optional[List[str]]:
+        """A venue's artists for a month in saved order, or None if no list was saved."""
+        with self._lock:
+            if not self._conn.execute(
+                    "SELECT 1 FROM artist_lists WHERE city = ? AND venue_key = ? AND month = ?",
+                    (city, venue_key, month)).fetchone():
+                return None
+            rows = self._conn.execute(
+                "SELECT artist FROM artists WHERE city = ? AND venue_key = ? AND month = ? ORDER BY position",
+                (city, venue_key, month)
+            ).fetchall()
+        return [artist for artist, in rows]
+
+    def artists_for_month(self, city: str, month: str) -> Dict[str, List[str]]:
+        """Every venue's artists for a month, keyed by venue."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT venue_key, artist FROM artists WHERE city = ? AND month = ? ORDER BY venue_key, position",
+                (city, month)
+            ).fetchall()
+        artists: Dict[str, List[str]] = {}
+        for venue_key, artist in rows:
+            artists.setdefault(venue_key, []).append(artist)
+        return artists
+
+    def playlist(self, city: str, venue_key: str, month: str) -> Optional[Tuple[str, str]]:
+        """A venue's (playlist_url, created) for a month, if any."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT playlist_url, created FROM playlists WHERE city = ? AND venue_key = ? AND month = ?",
+                (city, venue_key, month)
+            ).fetchone()
+
+    def freshness(self, city: str, venue_key: str, month: str) -> Tuple[Optional[str], Optional[str]]:
+        """When a venue-month's artists were last saved and its playlist created (ISO times or None)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT a.updated, p.created FROM (SELECT ? AS city, ? AS venue_key, ? AS month) k "
+                "LEFT JOIN artist_lists a USING (city, venue_key, month) "
+                "LEFT JOIN playlists p USING (city, venue_key, month)",
+                (city, venue_key, month)
+            ).fetchone()
+        return row[0], row[1]
+
+    def export_yaml(self, base_dir: str = "data/venue-data", city: Optional[str] = None) -> List[str]:
+        """Write stored artist lists and playlists back out in the YAML file layout."""
+        where, params = ("WHERE city = ?", (city,)) if city else ("", ())
+        with self._lock:
+            lists = self._conn.execute(
+                f"SELECT city, venue_key, month, updated FROM artist_lists {where}", params
+            ).fetchall()
+            playlists = self._conn.execute(
+                f"SELECT city, venue_key, month, playlist_url, created FROM playlists {where}", params
+            ).fetchall()
+
+        written = []
+        for list_city, venue_key, month, updated in lists:
+            data = {
+                "venue": venue_key,
+                "month": month,
+                "artists": self.venue_artists(list_city, venue_key, month),
+                "updated": updated
+            }
+            written.append(self._write_yaml(Path(base_dir) / list_city / venue_key / f"artists_{month}.yaml", data))
+        for list_city, venue_key, month, playlist_url, created in playlists:
+            data = {
+                'venue': venue_key,
+                'month': month,
+                'playlist_url': playlist_url,
+                'created': created
+            }
+            written.append(self._write_yaml(Path(base_dir) / list_city / venue_key / f"playlist_{month}.yaml", data))
+        logger.info(f"Exported {len(written)} YAML files from {self.path}")
+        return written
+
+    @staticmethod
+    def _write_yaml(path: Path, data: dict) -> str:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+        return str(path)
+
+_store: Optional[EventStore] = None
+_store_lock = threading.Lock()
+
+def get_event_store() -> Optional[EventStore]:
+    """Return the process-wide store when VENUE_DB is set, otherwise None."""
+    global _store
+    if not VENUE_DB:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = EventStore(VENUE_DB)
+        return _store
@@ -0,0 +1,158 @@
+import os
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Base directory for persistent caches
+CACHE_DIR = os.environ.get('VENUE_CACHE_DIR', '.cache')
+
+# Journal records appended before the index is rewritten in full
+JOURNAL_COMPACT_RECORDS = 256
+
+class DiskCache:
+    """Persistent key/bytes cache with a size cap and LRU eviction.
+
+    Each entry is stored as its own file next to an ``index.json`` that keeps
+    per-entry metadata and access times. Changes are appended to an
+    ``index.log`` journal and folded into ``index.json`` every
+    ``JOURNAL_COMPACT_RECORDS`` records, so a write doesn't rewrite the whole
+    index. Entries older than ``ttl`` seconds (if set) are treated as missing.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, ttl: Optional[float] = None):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._index: Optional[Dict[str, dict]] = None
+        self._journal_records = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, dict]]:
+        """Return the cached bytes and metadata for a key, or None."""
+        with self._lock:
+            index = self._load_index()
+            entry = index.get(key)
+            if entry is None:
+                return None
+
+            if self.ttl is not None and time.time() - entry['stored'] > self.ttl:
+                self._remove(key)
+                return None
+
+            try:
+                data = self._path(key).read_bytes()
+            except OSError:
+                self._remove(key)
+                return None
+
+            # Access times reach disk with the next compaction; losing a few only blurs LRU order
+            entry['accessed'] = time.time()
+            return data, entry['meta']
+
+    def set(self, key: str, data: bytes, meta: Optional[dict] = None) -> None:
+        """Store bytes and metadata under a key, evicting old entries if over the size cap."""
+        with self._lock:
+            index = self._load_index()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(self._path(key), data)
+
+            now = time.time()
+            index[key] = {
+                'size': len(data),
+                'stored': now,
+                'accessed': now,
+                'meta': meta or {}
+            }
+            self._append_journal({'set': key, 'entry': index[key]})
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._load_index()
+            self._remove(key)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        index = self._index
+        total = sum(entry['size'] for entry in index.values())
+        if total <= self.max_bytes:
+            return
+
+        for key in sorted(index, key=lambda k: index[k]['accessed']):
+            if total <= self.max_bytes:
+                break
+            total -= index[key]['size']
+            self._remove(key)
+            logger.debug(f"Evicted cache entry {key} from {self.directory}")
+
+    def _remove(self, key: str) -> None:
+        """Delete an entry's file and index record."""
+        if self._index.pop(key, None) is not None:
+            self._append_journal({'delete': key})
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.bin"
+
+    def _load_index(self) -> Dict[str, dict]:
+        """Load the index and replay its journal from disk once per instance."""
+        if self._index is None:
+            try:
+                with open(self.directory / "index.json") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+            try:
+                with open(self.directory / "index.log") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            # A write cut short by a crash; the records before it still count
+                            continue
+                        if 'set' in record:
+                            self._index[record['set']] = record['entry']
+                        else:
+                            self._index.pop(record.get('delete'), None)
+                        self._journal_records += 1
+            except OSError:
+                pass
+        return self._index
+
+    def _append_journal(self, record: dict) -> None:
+        """Record one index change, folding the journal into index.json once it grows long."""
+        if not self.directory.exists():
+            return
+        with open(self.directory / "index.log", 'a') as f:
+            f.write(json.dumps(record) + '\n')
+        self._journal_records += 1
+        if self._journal_records >= JOURNAL_COMPACT_RECORDS:
+            self._save_index()
+
+    def _save_index(self) -> None:
+        """Write the full index and start an empty journal."""
+        if not self.directory.exists():
+            return
+        self._atomic_write(self.directory / "index.json", json.dumps(self._index).encode('utf-8'))
+        try:
+            (self.directory / "index.log").unlink()
+        except OSError:
+            pass
+        self._journal_records = 0
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        """Write a file via a temporary file and rename so readers never see partial data."""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
@@ -0,0 +1,57 @@
+import logging
+import time
+from typing import List, Optional
+from .chunk_filter import ChunkFilter, strip_boilerplate
+from .models import ArtistEvent
+from .rule_extractor import RuleBasedExtractor
+from .text_utils import chunk_message, chunk_token_budget
+
+logger = logging.getLogger(__name__)
+
+class CalendarEventExtractor:
+    """Extract events from calendar text locally, asking OpenAI only about chunks the rules can't parse.
+
+    Boilerplate lines, chunks without dates and near-duplicate chunks are
+    dropped before either extractor sees them.
+    """
+
+    def __init__(self, rules: Optional[RuleBasedExtractor] = None, llm_extractor=None):
+        self.rules = rules or RuleBasedExtractor()
+        # Created on first leftover chunk so pages the rules handle need no API key
+        self._llm_extractor = llm_extractor
+
+    @property
+    def llm_extractor(self):
+        if self._llm_extractor is None:
+            from .openai_extractor import ArtistExtractor
+            self._llm_extractor = ArtistExtractor()
+        return self._llm_extractor
+
+    def extract(self, text: str, venue_name: str = "") -> List[ArtistEvent]:
+        """Return the unique events in calendar text, tagged with the venue name."""
+        start = time.perf_counter()
+        events = []
+        leftovers = []
+        chunks = chunk_message(strip_boilerplate(text), max_tokens=chunk_token_budget())
+        for chunk in ChunkFilter().filter(chunks):
+            chunk_events, confident = self.rules.extract(chunk)
+            if confident:
+                events.extend(chunk_events)
+            else:
+                leftovers.append(chunk)
+        logger.info(f"Rules extracted {len(events)} events in {(time.perf_counter() - start) * 1000:.1f}ms, "
+                    f"{len(leftovers)} chunks left for OpenAI")
+
+        if leftovers:
+            events.extend(self.llm_extractor.process_chunks(leftovers))
+
+        seen = set()
+        unique_events = []
+        for event in events:
+            key = (event.name.casefold(), event.date.date())
+            if key in seen:
+                continue
+            seen.add(key)
+            event.venue = venue_name
+            unique_events.append(event)
+        return unique_events
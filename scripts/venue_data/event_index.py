@@ -0,0 +1,62 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from .models import ArtistEvent
+
+def local_naive(date: datetime) -> datetime:
+    """Drop a datetime's timezone, keeping the venue's wall-clock time, so aware and naive dates compare."""
+    if date.tzinfo is not None:
+        return date.replace(tzinfo=None)
+    return date
+
+def parse_month(month: str) -> Tuple[int, int]:
+    """Turn a 'Month_YYYY' label into (year, month)."""
+    parsed = datetime.strptime(month, "%B_%Y")
+    return parsed.year, parsed.month
+
+class EventIndex:
+    """Events sorted once by date, bucketed by (year, month) and searchable by date window."""
+
+    def __init__(self, events: Iterable[ArtistEvent]):
+        keyed = sorted(((local_naive(event.date), event) for event in events), key=lambda pair: pair[0])
+        self._dates = [date for date, _ in keyed]
+        self._events = [event for _, event in keyed]
+
+        # (year, month) -> [start, end) slice of the sorted events
+        self._months: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        start = 0
+        for i in range(1, len(self._dates) + 1):
+            if i == len(self._dates) or (self._dates[i].year, self._dates[i].month) != (
+                    self._dates[start].year, self._dates[start].month):
+                self._months[(self._dates[start].year, self._dates[start].month)] = (start, i)
+                start = i
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def months(self) -> List[Tuple[int, int]]:
+        """The (year, month) buckets that hold events, in date order."""
+        return list(self._months)
+
+    def month(self, year: int, month: int) -> List[ArtistEvent]:
+        """Events in a calendar month, in date order."""
+        start, end = self._months.get((year, month), (0, 0))
+        return self._events[start:end]
+
+    def unique_month(self, year: int, month: int) -> List[ArtistEvent]:
+        """Events in a calendar month with repeat artists dropped, keeping each artist's first date."""
+        seen = set()
+        return [event for event in self.month(year, month) if not (event.name in seen or seen.add(event.name))]
+
+    def between(self, start: datetime, end: datetime) -> List[ArtistEvent]:
+        """Events on or after start and before end."""
+        return self._events[bisect_left(self._dates, local_naive(start)):bisect_left(self._dates, local_naive(end))]
+
+    def upcoming(self, horizon: timedelta, now: Optional[datetime] = None) -> List[ArtistEvent]:
+        """Events from the start of today until the horizon has passed, e.g. ``timedelta(days=7)``."""
+        start = local_naive(now or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.between(start, start + horizon)
+
+    def next_days(self, days: int, now: Optional[datetime] = None) -> List[ArtistEvent]:
+        """Events in the next ``days`` days, today included."""
+        return self.upcoming(timedelta(days=days), now)
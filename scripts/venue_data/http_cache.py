@@ -0,0 +1,91 @@
+import os
+import hashlib
+import logging
+import threading
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from .disk_cache import DiskCache, CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Size cap for cached venue pages
+HTTP_CACHE_MAX_MB = int(os.environ.get('HTTP_CACHE_MAX_MB', 100))
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that revalidates GET responses against an on-disk cache.
+
+    Responses carrying an ETag or Last-Modified header are stored; later
+    requests for the same URL send If-None-Match / If-Modified-Since and a
+    304 is answered with the cached body. Such responses have
+    ``from_cache`` set to True.
+    """
+
+    def __init__(self, cache: DiskCache, **kwargs):
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        key = hashlib.sha256(request.url.encode('utf-8')).hexdigest()
+        cached = self.cache.get(key)
+        if cached:
+            _, meta = cached
+            if meta.get('etag'):
+                request.headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request.headers['If-Modified-Since'] = meta['last_modified']
+
+        response = super().send(request, **kwargs)
+        response.from_cache = False
+
+        if response.status_code == 304 and cached:
+            logger.debug(f"Serving {request.url} from HTTP cache (304 Not Modified)")
+            return self._build_cached_response(request, response, *cached)
+
+        if response.status_code == 200:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self.cache.set(key, response.content, {
+                    'url': request.url,
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'headers': dict(response.headers)
+                })
+            elif cached:
+                self.cache.delete(key)
+
+        return response
+
+    def _build_cached_response(self, request, not_modified, body: bytes, meta: dict) -> requests.Response:
+        """Turn a 304 into a full 200 response using the cached body."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(meta.get('headers', {}))
+        response.headers.update(not_modified.headers)
+        response._content = body
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = not_modified.url or request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = not_modified.elapsed
+        response.from_cache = True
+        not_modified.close()
+        return response
+
+_shared_cache: Optional[DiskCache] = None
+_shared_cache_lock = threading.Lock()
+
+def get_http_cache() -> DiskCache:
+    """Return the process-wide HTTP response cache."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = DiskCache(os.path.join(CACHE_DIR, 'http'), HTTP_CACHE_MAX_MB * 1024 * 1024)
+        return _shared_cache
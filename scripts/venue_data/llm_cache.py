@@ -0,0 +1,32 @@
+import os
+import json
+import hashlib
+import threading
+from typing import Optional
+from .disk_cache import DiskCache, CACHE_DIR
+
+# Cached completions expire after this many days
+LLM_CACHE_TTL_DAYS = float(os.environ.get('LLM_CACHE_TTL_DAYS', 30))
+
+# Size cap for cached completions
+LLM_CACHE_MAX_MB = int(os.environ.get('LLM_CACHE_MAX_MB', 50))
+
+def llm_cache_key(model: str, prompt: str, chunk: str) -> str:
+    """Content address for a completion request."""
+    payload = json.dumps([model, prompt, chunk], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+_shared_cache: Optional[DiskCache] = None
+_shared_cache_lock = threading.Lock()
+
+def get_llm_cache() -> DiskCache:
+    """Return the process-wide completion cache."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = DiskCache(
+                os.path.join(CACHE_DIR, 'llm'),
+                LLM_CACHE_MAX_MB * 1024 * 1024,
+                ttl=LLM_CACHE_TTL_DAYS * 24 * 3600
+            )
+        return _shared_cache
@@ -0,0 +1,108 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+# Per-city file recording when each venue-month's artists and playlist were generated
+MANIFEST_FILE = ".manifest.json"
+
+# Playlists older than this are regenerated
+PLAYLIST_MAX_AGE = timedelta(days=1)
+
+_cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+_lock = threading.Lock()
+
+def content_hash(value) -> str:
+    """Stable hash of JSON-serializable content."""
+    return hashlib.sha256(json.dumps(value, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def manifest_path(city_path: str) -> Path:
+    return Path(city_path) / MANIFEST_FILE
+
+def load_manifest(city_path: str) -> dict:
+    """Read a city's manifest ({venue: {month: entry}}), reusing the parsed copy while the file is unchanged."""
+    path = manifest_path(city_path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    with _lock:
+        cached = _cache.get(str(path))
+        if cached and cached[0] == key:
+            return cached[1]
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+        return {}
+    with _lock:
+        _cache[str(path)] = (key, data)
+    return data
+
+def update_manifest(city_path: str, venue_key: str, month: str, **fields) -> None:
+    """Merge fields into a venue-month's manifest entry, safely across threads and processes."""
+    path = manifest_path(city_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _lock, FileLock(str(path) + ".lock"):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        data.setdefault(venue_key, {}).setdefault(month, {}).update(fields)
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+
+def record_artists(city_path: str, venue_key: str, month: str, artists: List[str], updated: str) -> None:
+    """Record that a venue-month's artist list was written."""
+    update_manifest(city_path, venue_key, month, artists_updated=updated, artists_hash=content_hash(artists))
+
+def record_playlist(city_path: str, venue_key: str, month: str, playlist_url: str, created: str) -> None:
+    """Record a venue-month's new playlist and the artist list it was built from."""
+    entry = load_manifest(city_path).get(venue_key, {}).get(month, {})
+    update_manifest(
+        city_path, venue_key, month,
+        playlist_created=created,
+        playlist_hash=content_hash(playlist_url),
+        playlist_artists_hash=entry.get('artists_hash')
+    )
+
+def stale_reason(entry: Optional[dict], now: Optional[datetime] = None) -> Optional[str]:
+    """Why a venue-month's playlist needs regenerating, or None if it is fresh."""
+    if not entry or not entry.get('artists_updated'):
+        return "no artists recorded"
+    if not entry.get('playlist_created'):
+        return "no playlist yet"
+    if entry.get('playlist_artists_hash') != entry.get('artists_hash'):
+        return "artists changed since playlist"
+    age = (now or datetime.now()) - datetime.fromisoformat(entry['playlist_created'])
+    if age >= PLAYLIST_MAX_AGE:
+        return f"playlist is {age.days}d old"
+    return None
+
+def plan(city_path: str, venue_keys: Iterable[str], months: Iterable[str],
+         now: Optional[datetime] = None) -> List[Tuple[str, str, str]]:
+    """List (venue, month, reason) for every stale venue-month, from one manifest read."""
+    manifest = load_manifest(city_path)
+    months = list(months)
+    stale = []
+    for venue_key in venue_keys:
+        entries = manifest.get(venue_key, {})
+        for month in months:
+            reason = stale_reason(entries.get(month), now)
+            if reason:
+                stale.append((venue_key, month, reason))
+    return stale
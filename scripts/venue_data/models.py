@@ -1,26 +1,91 @@
-from dataclasses import dataclass
+import sys
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share one copy of strings that repeat across many events."""
+    return sys.intern(value) if value is not None else None
 
-@dataclass
 class ArtistEvent:
-    """Represents an artist event at a venue."""
-    name: str
-    date: datetime
-    venue: str
-    scraper_type: Optional[str] = None  # Added to track which scraper found this event
-    
-    def __post_init__(self):
-        """Validate and clean data after initialization."""
+    """Represents an artist event at a venue.
+
+    Slotted to keep large event sets small; venue and scraper type strings
+    are interned so every event at a venue shares one copy.
+    """
+    __slots__ = ('name', 'date', '_venue', '_scraper_type')
+
+    def __init__(self, name: str, date: datetime, venue: str, scraper_type: Optional[str] = None):
+        """Validate and clean data on construction."""
         # Ensure name is a string and stripped
-        self.name = str(self.name).strip()
-        
+        self.name = str(name).strip()
+
         # Ensure date is a datetime
-        if isinstance(self.date, str):
+        if isinstance(date, str):
             try:
-                self.date = datetime.fromisoformat(self.date)
+                date = datetime.fromisoformat(date)
             except ValueError as e:
                 raise ValueError(f"Invalid date format for {self.name}: {e}")
-                
+        self.date = date
+
         # Ensure venue is a string
-        self.venue = str(self.venue).strip()
\ No newline at end of file
+        self.venue = str(venue).strip()
+        self.scraper_type = scraper_type  # Tracks which scraper found this event
+
+    @classmethod
+    def from_trusted(cls, name: str, date: datetime, venue: str,
+                     scraper_type: Optional[str] = None) -> 'ArtistEvent':
+        """Build an event from already clean fields without revalidating them."""
+        event = cls.__new__(cls)
+        event.name = name
+        event.date = date
+        event._venue = _intern(venue)
+        event._scraper_type = _intern(scraper_type)
+        return event
+
+    @classmethod
+    def bulk(cls, rows: Iterable[Tuple[str, datetime]], venue: str,
+             scraper_type: Optional[str] = None) -> List['ArtistEvent']:
+        """Build events for one venue from trusted (name, date) pairs."""
+        venue = _intern(venue)
+        scraper_type = _intern(scraper_type)
+        new = cls.__new__
+        events = []
+        for name, date in rows:
+            event = new(cls)
+            event.name = name
+            event.date = date
+            event._venue = venue
+            event._scraper_type = scraper_type
+            events.append(event)
+        return events
+
+    @property
+    def venue(self) -> str:
+        return self._venue
+
+    @venue.setter
+    def venue(self, value: str) -> None:
+        self._venue = _intern(value)
+
+    @property
+    def scraper_type(self) -> Optional[str]:
+        return self._scraper_type
+
+    @scraper_type.setter
+    def scraper_type(self, value: Optional[str]) -> None:
+        self._scraper_type = _intern(value)
+
+    def _fields(self) -> tuple:
+        return (self.name, self.date, self._venue, self._scraper_type)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    # Mutable like the dataclass it replaced, so not hashable
+    __hash__ = None
+
+    def __repr__(self):
+        return (f"ArtistEvent(name={self.name!r}, date={self.date!r}, "
+                f"venue={self._venue!r}, scraper_type={self._scraper_type!r})")
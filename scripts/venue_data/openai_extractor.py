@@ -1,63 +1,95 @@
 from openai import OpenAI
 import os
-from functools import lru_cache
-from typing import List
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from . import constants
 from .models import ArtistEvent
+from .disk_cache import DiskCache
+from .llm_cache import get_llm_cache, llm_cache_key
+from .rate_limit import TokenRateLimiter, get_openai_limiter, OPENAI_MAX_CONCURRENCY
+from .text_utils import count_tokens
 from datetime import datetime
 
+# Model used for artist extraction
+MODEL = "gpt-3.5-turbo"
+
 class ArtistExtractor:
-    def __init__(self):
+    def __init__(self, cache: Optional[DiskCache] = None, max_concurrency: int = OPENAI_MAX_CONCURRENCY,
+                 limiter: Optional[TokenRateLimiter] = None):
         self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        self.cache = cache or get_llm_cache()
+        self.max_concurrency = max_concurrency
+        self.limiter = limiter or get_openai_limiter()
         
-    @lru_cache(maxsize=32)
     def extract_artists_from_text(self, text: str) -> List[ArtistEvent]:
         """Extract artist names and dates from text using OpenAI."""
         try:
-            print(f"Sending chunk of length {len(text)} to OpenAI")
-            completion = self.client.chat.completions.create(
-                messages=[{"role": "user", "content": constants.MESSAGE_PREFIX + text}],
-                model="gpt-3.5-turbo",
-            )
-            print(f"OpenAI response: {completion.choices[0].message.content[:200]}")
-            
-            artist_events = []
-            current_year = datetime.now().year
-            for line in completion.choices[0].message.content.split("\n"):
-                if "|" in line:
-                    artist, date_str = line.split("|")
-                    try:
-                        # Handle "MMM DD" format
-                        date_str = date_str.strip()
-                        if len(date_str) == 6:  # "NOV 09" format
-                            date = datetime.strptime(f"{current_year} {date_str}", "%Y %b %d")
-                            # If date is in the past, assume next year
-                            if date < datetime.now():
-                                date = date.replace(year=current_year + 1)
-                        else:
-                            # Try original YYYY-MM-DD format
-                            date = datetime.strptime(date_str, "%Y-%m-%d")
-                        
-                        artist_events.append(ArtistEvent(
-                            name=artist.strip(),
-                            date=date
-                        ))
-                    except ValueError as e:
-                        print(f"Error parsing date '{date_str}': {e}")
-                        continue
-            print("\nDEBUG: Raw OpenAI response lines:")
-            for line in completion.choices[0].message.content.split("\n"):
-                print(f"  > {line}")
-            return artist_events
+            content = self._complete(text)
+            return self._parse_response(content)
         except Exception as e:
             print(f"Error extracting artists: {e}")
             return []
 
+    def _complete(self, text: str) -> str:
+        """Get the model's answer for a chunk, reusing a cached answer for identical input."""
+        key = llm_cache_key(MODEL, constants.MESSAGE_PREFIX, text)
+        cached = self.cache.get(key)
+        if cached:
+            print(f"Using cached OpenAI response for chunk of length {len(text)}")
+            return cached[0].decode('utf-8')
+
+        prompt = constants.MESSAGE_PREFIX + text
+        self.limiter.acquire(count_tokens(prompt, MODEL) + constants.RESPONSE_TOKEN_ESTIMATE)
+        print(f"Sending chunk of length {len(text)} to OpenAI")
+        completion = self.client.chat.completions.create(
+            messages=[{"role": "user", "content": prompt}],
+            model=MODEL,
+        )
+        content = completion.choices[0].message.content
+        print(f"OpenAI response: {content[:200]}")
+        self.cache.set(key, content.encode('utf-8'), {'model': MODEL})
+        return content
+
+    def _parse_response(self, content: str) -> List[ArtistEvent]:
+        """Parse 'Artist | MMM DD' lines from a model response."""
+        artist_events = []
+        current_year = datetime.now().year
+        for line in content.split("\n"):
+            if "|" in line:
+                artist, date_str = line.split("|")
+                try:
+                    # Handle "MMM DD" format
+                    date_str = date_str.strip()
+                    if len(date_str) == 6:  # "NOV 09" format
+                        date = datetime.strptime(f"{current_year} {date_str}", "%Y %b %d")
+                        # If date is in the past, assume next year
+                        if date < datetime.now():
+                            date = date.replace(year=current_year + 1)
+                    else:
+                        # Try original YYYY-MM-DD format
+                        date = datetime.strptime(date_str, "%Y-%m-%d")
+                    
+                    artist_events.append(ArtistEvent(
+                        name=artist.strip(),
+                        date=date,
+                        venue=""  # Will be set by venue processor
+                    ))
+                except ValueError as e:
+                    print(f"Error parsing date '{date_str}': {e}")
+                    continue
+        print("\nDEBUG: Raw OpenAI response lines:")
+        for line in content.split("\n"):
+            print(f"  > {line}")
+        return artist_events
+
     def process_chunks(self, chunks: List[str]) -> List[ArtistEvent]:
         """Process multiple text chunks and return unique artists with dates."""
         all_artists = []
-        for chunk in chunks:
-            all_artists.extend(self.extract_artists_from_text(chunk))
+        if chunks:
+            # Chunks run concurrently; map keeps results in chunk order for the dedup below
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as executor:
+                for artist_events in executor.map(self.extract_artists_from_text, chunks):
+                    all_artists.extend(artist_events)
         
         # Remove duplicates while preserving order
         seen = set()
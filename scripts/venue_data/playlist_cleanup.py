@@ -1,46 +1,120 @@
 import logging
-from typing import List, Optional
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional
 from datetime import datetime, timedelta
 import spotipy
+from spotipy.exceptions import SpotifyException
 from pathlib import Path
 import yaml
+from .rate_limit import spotify_session
 
 logger = logging.getLogger(__name__)
 
+# Playlists unfollowed at the same time
+CLEANUP_CONCURRENCY = int(os.environ.get('CLEANUP_CONCURRENCY', 4))
+
+# Times a rate-limited call is retried before giving up
+MAX_RATE_LIMIT_RETRIES = 5
+
 class PlaylistCleaner:
     """Utility for cleaning up test playlists."""
     
-    def __init__(self, spotify_client: Optional[spotipy.Spotify] = None):
+    def __init__(self, spotify_client: Optional[spotipy.Spotify] = None, max_concurrency: int = CLEANUP_CONCURRENCY):
         """Initialize with optional spotify client."""
-        self.sp = spotify_client or spotipy.Spotify(auth_manager=spotipy.oauth2.SpotifyOAuth())
-        
-    def cleanup_test_playlists(self, older_than_hours: int = 24) -> List[str]:
-        """Clean up test playlists older than specified hours."""
-        cleaned_playlists = []
+        # 429s must reach _call, which honors Retry-After across all workers
+        self.sp = spotify_client or spotipy.Spotify(auth_manager=spotipy.oauth2.SpotifyOAuth(),
+                                                    requests_session=spotify_session())
+        self.max_concurrency = max_concurrency
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+    
+    def iter_playlists(self, page_size: int = 50) -> Iterator[dict]:
+        """Yield every playlist the user follows, fetching pages as they are needed.
+
+        Pages are read by offset, so don't unfollow playlists while iterating:
+        each removal shifts later playlists to lower offsets and some are skipped.
+        """
+        page = self._call(self.sp.current_user_playlists, limit=page_size)
+        while page:
+            yield from page['items']
+            page = self._call(self.sp.next, page) if page.get('next') else None
+    
+    def find_test_playlists(self, older_than_hours: int = 24) -> Iterator[dict]:
+        """Yield [TEST] playlists created before the cutoff."""
         cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
-        
-        # Get user's playlists
-        playlists = self.sp.current_user_playlists()
-        
-        for playlist in playlists['items']:
+        for playlist in self.iter_playlists():
             # Check if it's a test playlist (has [TEST] prefix)
-            if playlist['name'].startswith('[TEST]'):
+            if playlist and playlist['name'].startswith('[TEST]'):
                 # Get creation time from playlist description
                 created_at = self._get_playlist_creation_time(playlist)
                 if created_at and created_at < cutoff_time:
-                    try:
-                        self.sp.current_user_unfollow_playlist(playlist['id'])
-                        cleaned_playlists.append(playlist['id'])
-                        logger.info(f"Cleaned up test playlist: {playlist['name']} ({playlist['id']})")
-                    except Exception as e:
-                        logger.error(f"Failed to delete playlist {playlist['id']}: {e}")
+                    yield playlist
+        
+    def cleanup_test_playlists(self, older_than_hours: int = 24, dry_run: bool = False) -> List[str]:
+        """Clean up test playlists older than specified hours.
         
+        Every page is read before anything is unfollowed, since unfollowing
+        shifts the offsets of later pages; the unfollows then run on a bounded
+        pool. With ``dry_run`` nothing is deleted; the IDs that would be are
+        returned.
+        """
+        start = time.perf_counter()
+        matched = list(self.find_test_playlists(older_than_hours))
+        
+        if dry_run:
+            for playlist in matched:
+                print(f"Would clean up: {playlist['name']} ({playlist['id']})")
+            elapsed = time.perf_counter() - start
+            print(f"Dry run: {len(matched)} test playlists would be cleaned up ({elapsed:.1f}s)")
+            return [playlist['id'] for playlist in matched]
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            cleaned_playlists = [playlist_id for playlist_id in executor.map(self._unfollow, matched) if playlist_id]
+        
+        elapsed = time.perf_counter() - start
+        
+        failed = len(matched) - len(cleaned_playlists)
+        print(f"Cleaned up {len(cleaned_playlists)} of {len(matched)} test playlists"
+              f"{f', {failed} failed' if failed else ''} ({elapsed:.1f}s)")
         return cleaned_playlists
     
+    def _unfollow(self, playlist: dict) -> Optional[str]:
+        """Unfollow one playlist, returning its ID on success."""
+        try:
+            self._call(self.sp.current_user_unfollow_playlist, playlist['id'])
+            logger.info(f"Cleaned up test playlist: {playlist['name']} ({playlist['id']})")
+            return playlist['id']
+        except Exception as e:
+            logger.error(f"Failed to delete playlist {playlist['id']}: {e}")
+            return None
+    
+    def _call(self, func: Callable, *args, **kwargs):
+        """Call the Spotify API, pausing all workers for Retry-After when rate limited."""
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            with self._lock:
+                delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                return func(*args, **kwargs)
+            except SpotifyException as e:
+                if e.http_status != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                try:
+                    retry_after = float((e.headers or {}).get('Retry-After', 1))
+                except (TypeError, ValueError):
+                    retry_after = 1.0
+                logger.warning(f"Rate limited by Spotify, retrying in {retry_after:.0f}s")
+                with self._lock:
+                    self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+    
     def cleanup_specific_playlist(self, playlist_id: str) -> bool:
         """Clean up a specific playlist by ID."""
         try:
-            self.sp.current_user_unfollow_playlist(playlist_id)
+            self._call(self.sp.current_user_unfollow_playlist, playlist_id)
             logger.info(f"Cleaned up playlist: {playlist_id}")
             return True
         except Exception as e:
@@ -64,10 +138,12 @@ if __name__ == "__main__":
     parser.add_argument("--hours", type=int, default=24, 
                        help="Clean up playlists older than this many hours")
     parser.add_argument("--playlist-id", help="Clean up a specific playlist")
+    parser.add_argument("--dry-run", action="store_true", help="Only report which playlists would be cleaned up")
+    parser.add_argument("--workers", type=int, default=CLEANUP_CONCURRENCY, help="Playlists unfollowed at once")
     args = parser.parse_args()
     
-    cleaner = PlaylistCleaner()
+    cleaner = PlaylistCleaner(max_concurrency=args.workers)
     if args.playlist_id:
         cleaner.cleanup_specific_playlist(args.playlist_id)
     else:
-        cleaner.cleanup_test_playlists(args.hours) 
\ No newline at end of file
+        cleaner.cleanup_test_playlists(args.hours, dry_run=args.dry_run) 
\ No newline at end of file
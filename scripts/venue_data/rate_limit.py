@@ -0,0 +1,150 @@
+import os
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Default per-host limits for venue page requests
+DEFAULT_MAX_PER_HOST = 2
+DEFAULT_MIN_INTERVAL = 1.0
+
+# Default OpenAI budgets shared by all extractors in a process
+OPENAI_MAX_CONCURRENCY = int(os.environ.get('OPENAI_MAX_CONCURRENCY', 4))
+OPENAI_REQUESTS_PER_MINUTE = int(os.environ.get('OPENAI_REQUESTS_PER_MINUTE', 500))
+OPENAI_TOKENS_PER_MINUTE = int(os.environ.get('OPENAI_TOKENS_PER_MINUTE', 60000))
+
+# Spotify server errors retried inside the HTTP session; 429 is left to the caller's limiter
+SPOTIFY_SERVER_ERRORS = (500, 502, 503, 504)
+
+class HostRateLimiter:
+    """Limit concurrent requests and request rate per host.
+
+    At most ``max_concurrent`` requests to a host run at once, and request
+    starts to the same host are spaced at least ``min_interval`` seconds apart.
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_PER_HOST, min_interval: float = DEFAULT_MIN_INTERVAL):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def limit(self, url: str):
+        """Hold a request slot for the URL's host for the duration of a ``with`` block."""
+        host = urlparse(url).netloc
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_concurrent)
+                self._semaphores[host] = semaphore
+
+        with semaphore:
+            self._wait_for_turn(host)
+            yield
+
+    def _wait_for_turn(self, host: str) -> None:
+        """Sleep until the host's minimum request interval has passed."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.min_interval
+
+        delay = start - now
+        if delay > 0:
+            logger.debug(f"Rate limiting {host}: waiting {delay:.2f}s")
+            time.sleep(delay)
+
+_shared_limiter: Optional[HostRateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+def get_host_limiter() -> HostRateLimiter:
+    """Return the process-wide host rate limiter, creating it on first use."""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = HostRateLimiter()
+        return _shared_limiter
+
+def configure_host_limiter(max_concurrent: int = DEFAULT_MAX_PER_HOST,
+                           min_interval: float = DEFAULT_MIN_INTERVAL) -> HostRateLimiter:
+    """Replace the process-wide host rate limiter with new limits."""
+    global _shared_limiter
+    with _shared_limiter_lock:
+        _shared_limiter = HostRateLimiter(max_concurrent, min_interval)
+        return _shared_limiter
+
+class TokenRateLimiter:
+    """Keep requests and tokens within per-minute budgets over a sliding window."""
+
+    def __init__(self, requests_per_minute: int = OPENAI_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: int = OPENAI_TOKENS_PER_MINUTE, window: float = 60.0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        self._sent = deque()  # (timestamp, tokens) of requests inside the window
+        self._tokens_in_window = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> None:
+        """Block until a request costing ``tokens`` fits in both budgets, then record it."""
+        # A single request bigger than the whole budget is let through on an empty window
+        tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0][0] >= self.window:
+                    _, expired = self._sent.popleft()
+                    self._tokens_in_window -= expired
+
+                if (len(self._sent) < self.requests_per_minute
+                        and self._tokens_in_window + tokens <= self.tokens_per_minute):
+                    self._sent.append((now, tokens))
+                    self._tokens_in_window += tokens
+                    return
+
+                delay = self.window - (now - self._sent[0][0])
+
+            logger.debug(f"Rate limiting OpenAI requests: waiting {delay:.2f}s")
+            time.sleep(max(delay, 0.01))
+
+_openai_limiter: Optional[TokenRateLimiter] = None
+
+def get_openai_limiter() -> TokenRateLimiter:
+    """Return the process-wide OpenAI request/token limiter."""
+    global _openai_limiter
+    with _shared_limiter_lock:
+        if _openai_limiter is None:
+            _openai_limiter = TokenRateLimiter()
+        return _openai_limiter
+
+def spotify_session(retries: int = 3, backoff_factor: float = 0.3) -> requests.Session:
+    """HTTP session for spotipy that retries server errors but returns every 429 to the caller.
+
+    urllib3 would otherwise retry a 429 carrying Retry-After on its own,
+    hiding the throttle from the caller's rate limiting.
+    """
+    retry = Retry(
+        total=retries,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=SPOTIFY_SERVER_ERRORS,
+        respect_retry_after_header=False
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
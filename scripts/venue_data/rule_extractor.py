@@ -0,0 +1,206 @@
+import re
+import logging
+from datetime import datetime, date
+from typing import List, Optional, Tuple
+from .models import ArtistEvent
+
+logger = logging.getLogger(__name__)
+
+MONTHS = {
+    'jan': 1, 'january': 1,
+    'feb': 2, 'february': 2,
+    'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4,
+    'may': 5,
+    'jun': 6, 'june': 6,
+    'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8,
+    'sep': 9, 'sept': 9, 'september': 9,
+    'oct': 10, 'october': 10,
+    'nov': 11, 'november': 11,
+    'dec': 12, 'december': 12,
+}
+
+_MONTH_NAMES = '|'.join(sorted(MONTHS, key=len, reverse=True))
+_WEEKDAYS = r'(?:mon|tue|tues|wed|thu|thur|thurs|fri|sat|sun)(?:day|nesday|sday|urday)?'
+
+# "Fri, Jan 12", "January 12th, 2025", "12 Jan"
+MONTH_DAY_PATTERN = re.compile(
+    rf'\b(?:{_WEEKDAYS}\.?,?\s+)?(?:(?P<month>{_MONTH_NAMES})\.?\s+(?P<day>\d{{1,2}})(?:st|nd|rd|th)?'
+    rf'|(?P<day2>\d{{1,2}})(?:st|nd|rd|th)?\s+(?P<month2>{_MONTH_NAMES})\.?)'
+    rf'(?:,?\s+(?P<year>\d{{4}}))?\b',
+    re.IGNORECASE
+)
+# "2025-01-12"
+ISO_DATE_PATTERN = re.compile(r'\b(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})\b')
+# "1/12" or "1/12/25"
+NUMERIC_DATE_PATTERN = re.compile(
+    rf'\b(?:{_WEEKDAYS}\.?,?\s+)?(?P<month>\d{{1,2}})/(?P<day>\d{{1,2}})(?:/(?P<year>\d{{2}}|\d{{4}}))?\b',
+    re.IGNORECASE
+)
+DATE_PATTERNS = (ISO_DATE_PATTERN, MONTH_DAY_PATTERN, NUMERIC_DATE_PATTERN)
+
+# Show times and other listing noise around the artist name
+TIME_PATTERN = re.compile(
+    r'\b(?:doors|show|starts?)?\s*(?:@|at)?\s*\d{1,2}(?::\d{2})?\s*(?:am|pm)\b|\b\d{1,2}:\d{2}\b',
+    re.IGNORECASE
+)
+WEEKDAY_PATTERN = re.compile(rf'^\s*{_WEEKDAYS}\.?\s*$', re.IGNORECASE)
+SEPARATORS = ' \t-–—:|@•·,/()[]'
+ARTIST_PIPE_PATTERN = re.compile(r'^(?P<artist>[^|]+?)\s*\|\s*(?P<date>[^|]+)$')
+
+# Lines that look like listings but aren't artists
+NON_ARTIST_PATTERN = re.compile(
+    r'^(?:buy\s+)?tickets?\b|^(?:sold\s*out|more\s+info|rsvp|on\s+sale|free|all\s+ages|\d+\+|'
+    r'doors|show|today|tonight|tomorrow|upcoming(?:\s+events)?|events?|calendar|\$\s*\d)',
+    re.IGNORECASE
+)
+
+# Phrases that mark a line as a venue notice or promotion rather than a show; only
+# checked when no "Artist | date" separator says the text is a name
+NOTICE_PATTERN = re.compile(
+    r'\b(?:(?:tickets?\s+)?(?:go\s+)?on\s+sale|pre-?sale\s+(?:starts|begins|ends)|'
+    r'closed\s+(?:for|on|today|tonight)|re-?opens?\s+(?:on|at)|happy\s+hour|'
+    r'half[\s-]+price|\d+\s*%\s*off)\b',
+    re.IGNORECASE
+)
+
+# Longer candidates are prose, not artist names
+MAX_ARTIST_WORDS = 8
+
+# Share of date-bearing lines that must resolve to events for a chunk to be trusted
+MIN_RESOLVED_RATIO = 0.8
+
+class RuleBasedExtractor:
+    """Extract artist events from calendar text with precompiled patterns.
+
+    Recognizes 'Artist | date' lines, lines mixing an artist with a month-day
+    or numeric date, and listings where a date line and an artist line sit
+    next to each other. ``extract`` reports whether the chunk was parsed
+    confidently so that only the rest needs to go to a language model.
+    """
+
+    def __init__(self, today: Optional[date] = None):
+        self.today = today
+
+    def extract(self, text: str) -> Tuple[List[ArtistEvent], bool]:
+        """Return events found in text and whether the whole chunk was understood."""
+        today = self.today or datetime.now().date()
+        events = []
+        date_lines = 0
+        resolved = 0
+        pending_date = None   # date line still waiting for its artist
+        pending_artist = None  # artist line still waiting for its date
+
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            parsed = self._parse_line(line, today)
+            if parsed is None:
+                # No date on this line: maybe the artist for a neighbouring date line
+                candidate = self._clean_artist(line)
+                if pending_date and candidate:
+                    events.append(ArtistEvent.from_trusted(candidate, pending_date, ""))
+                    resolved += 1
+                    pending_date = None
+                elif candidate:
+                    pending_artist = candidate
+                continue
+
+            date_lines += 1
+            leftover, event_date, separated = parsed
+            artist = self._clean_artist(leftover, separated)
+            if artist:
+                events.append(ArtistEvent.from_trusted(artist, event_date, ""))
+                resolved += 1
+                pending_date = pending_artist = None
+            elif not self._is_date_only(leftover):
+                # A dated notice ("Closed Nov 27", "Tickets on sale Nov 1") isn't a show date;
+                # it stays unresolved so a chunk full of them goes to the model
+                pending_date = None
+            elif pending_artist:
+                events.append(ArtistEvent.from_trusted(pending_artist, event_date, ""))
+                resolved += 1
+                pending_artist = None
+            else:
+                pending_date = event_date
+
+        if not date_lines:
+            # Nothing dated to extract, so a model wouldn't find events either
+            return events, True
+        return events, resolved / date_lines >= MIN_RESOLVED_RATIO
+
+    def _parse_line(self, line: str, today: date) -> Optional[Tuple[str, datetime, bool]]:
+        """Parse a dated line into (text around the date, date, whether a '|' set the name apart).
+
+        Returns None if the line has no date.
+        """
+        match = ARTIST_PIPE_PATTERN.match(line)
+        if match:
+            event_date = self._find_date(match.group('date'), today)
+            if event_date:
+                return match.group('artist'), event_date[0], True
+
+        found = self._find_date(line, today)
+        if not found:
+            return None
+        event_date, start, end = found
+        return line[:start] + ' ' + line[end:], event_date, False
+
+    def _find_date(self, text: str, today: date) -> Optional[Tuple[datetime, int, int]]:
+        """Find the first parseable date in text with its span."""
+        for pattern in DATE_PATTERNS:
+            for match in pattern.finditer(text):
+                event_date = self._to_datetime(match, today)
+                if event_date:
+                    return event_date, match.start(), match.end()
+        return None
+
+    @staticmethod
+    def _to_datetime(match: re.Match, today: date) -> Optional[datetime]:
+        """Build a datetime from a date match, inferring the year when it's missing."""
+        groups = match.groupdict()
+        month = groups.get('month') or groups.get('month2')
+        day = groups.get('day') or groups.get('day2')
+        month = int(month) if month.isdigit() else MONTHS[month.lower()]
+        year = groups.get('year')
+
+        try:
+            if year:
+                year = int(year)
+                if year < 100:
+                    year += 2000
+                return datetime(year, month, int(day))
+
+            event_date = datetime(today.year, month, int(day))
+            # Listings without a year that fall before today are next year's shows
+            if event_date.date() < today:
+                event_date = event_date.replace(year=today.year + 1)
+            return event_date
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _strip_noise(text: str) -> str:
+        """Remove times and surrounding separators from text next to a date."""
+        text = TIME_PATTERN.sub(' ', text)
+        return ' '.join(text.split()).strip(SEPARATORS)
+
+    @classmethod
+    def _is_date_only(cls, text: str) -> bool:
+        """Whether the text around a date holds nothing but times and weekdays."""
+        text = cls._strip_noise(text)
+        return not any(c.isalpha() for c in text) or bool(WEEKDAY_PATTERN.match(text))
+
+    @classmethod
+    def _clean_artist(cls, text: str, separated: bool = False) -> str:
+        """Strip times, weekdays and separators around an artist name; '' if it isn't one."""
+        text = cls._strip_noise(text)
+        if (not text or len(text.split()) > MAX_ARTIST_WORDS or not any(c.isalpha() for c in text)
+                or WEEKDAY_PATTERN.match(text) or NON_ARTIST_PATTERN.match(text)
+                or (not separated and NOTICE_PATTERN.search(text))
+                or any(pattern.search(text) for pattern in DATE_PATTERNS)):
+            return ''
+        return text
@@ -1,18 +1,35 @@
+import threading
 import requests
-from bs4 import BeautifulSoup
+from .http_cache import CachingHTTPAdapter, get_http_cache
+from .text_extraction import extract_text
+
+_session = None
+_session_lock = threading.Lock()
+
+def _get_session() -> requests.Session:
+    """Return a shared session that revalidates pages against the HTTP cache."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = CachingHTTPAdapter(get_http_cache())
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+        return _session
 
 def fetch_venue_page(url: str) -> str:
     """Fetch venue page HTML."""
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     }
-    response = requests.get(url, headers=headers)
+    response = _get_session().get(url, headers=headers)
     return response.text
 
-def clean_calendar_text(html: str) -> str:
-    """Extract and clean calendar text from HTML."""
-    soup = BeautifulSoup(html, 'html.parser')
-    # Remove script and style elements
-    for element in soup(['script', 'style']):
-        element.decompose()
-    return soup.get_text() 
\ No newline at end of file
+def clean_calendar_text(html: str, engine: str = None) -> str:
+    """Extract and clean calendar text from HTML.
+    
+    ``engine`` picks a backend from ``text_extraction.TEXT_ENGINES``; the default
+    streaming tokenizer produces the same text as the original BeautifulSoup code.
+    """
+    return extract_text(html, engine)
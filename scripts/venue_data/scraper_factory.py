@@ -1,10 +1,18 @@
-from typing import Dict, Type
+from typing import Dict, List, Tuple, Type
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import os
+import time
 import logging
+from .models import ArtistEvent
 from .scrapers.base import VenueScraper
 from .scrapers.bandisintown import BandsInTownScraper
+from .scrapers.website import WebsiteScraper
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for a venue's scrapers when several run in parallel
+SCRAPER_DEADLINE = float(os.environ.get('SCRAPER_DEADLINE', 60))
+
 class ScraperFactory:
     """Factory for creating venue scrapers."""
     
@@ -35,12 +43,108 @@ class ScraperFactory:
         scraper_type = available_scrapers[0][0]
         return cls.get_scraper(scraper_type)
     
+    @classmethod
+    def get_events_for_venue(cls, venue_key: str, venue_info: dict,
+                             deadline: float = SCRAPER_DEADLINE) -> List[ArtistEvent]:
+        """Run all configured scrapers for a venue at once and merge their events.
+        
+        Returns as soon as the highest-priority source answers with events, when
+        every source has finished, or when the deadline (seconds) passes, merging
+        whatever has arrived by then. Events are deduplicated by artist and day,
+        keeping the higher-priority source's copy.
+        """
+        scrapers = venue_info.get('scrapers', {})
+        if not scrapers:
+            raise ValueError("No scrapers configured for venue")
+        
+        scraper_types = []
+        for scraper_type, _ in sorted(scrapers.items(), key=lambda x: x[1].get('priority', 999)):
+            if scraper_type in cls._scrapers:
+                scraper_types.append(scraper_type)
+            else:
+                logger.warning(f"Skipping unregistered scraper {scraper_type} for {venue_key}")
+        
+        if not scraper_types:
+            raise ValueError("No valid scrapers found")
+        
+        if len(scraper_types) == 1:
+            return cls._merge_events([(scraper_types[0], cls._run_scraper(scraper_types[0], venue_key, venue_info))])
+        
+        executor = ThreadPoolExecutor(max_workers=len(scraper_types))
+        futures = {
+            executor.submit(cls._run_scraper, scraper_type, venue_key, venue_info): scraper_type
+            for scraper_type in scraper_types
+        }
+        results: Dict[str, List[ArtistEvent]] = {}
+        errors: Dict[str, Exception] = {}
+        stop_at = time.monotonic() + deadline
+        pending = set(futures)
+        try:
+            while pending:
+                remaining = stop_at - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(f"Scraper deadline passed for {venue_key}, "
+                                   f"still waiting on: {', '.join(futures[f] for f in pending)}")
+                    break
+                
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        results[futures[future]] = future.result()
+                    except Exception as e:
+                        errors[futures[future]] = e
+                        logger.error(f"Scraper {futures[future]} failed for {venue_key}: {e}")
+                
+                # Stop once the best source still in the running has answered with events
+                leading = next((t for t in scraper_types if t not in errors and results.get(t) != []), None)
+                if leading is None or results.get(leading):
+                    break
+        finally:
+            executor.shutdown(wait=False)
+        
+        if not results and errors:
+            raise next(iter(errors.values()))
+        
+        return cls._merge_events([(t, results[t]) for t in scraper_types if t in results])
+    
+    @classmethod
+    def _run_scraper(cls, scraper_type: str, venue_key: str, venue_info: dict) -> List[ArtistEvent]:
+        """Fetch events for a venue with a single scraper."""
+        scraper = cls.get_scraper(scraper_type)
+        return scraper.get_events(venue_key, venue_info)
+    
+    @staticmethod
+    def _merge_events(results: List[Tuple[str, List[ArtistEvent]]]) -> List[ArtistEvent]:
+        """Merge per-scraper events in priority order, tagging each with its source."""
+        seen = set()
+        merged = []
+        for scraper_type, events in results:
+            for event in events:
+                key = (event.name.casefold(), event.date.strftime('%Y-%m-%d'))
+                if key in seen:
+                    continue
+                seen.add(key)
+                if not event.scraper_type:
+                    event.scraper_type = scraper_type
+                merged.append(event)
+        return merged
+    
     @classmethod
     def get_scraper(cls, scraper_type: str) -> VenueScraper:
         """Get a scraper instance by type."""
         if scraper_type not in cls._scrapers:
             raise ValueError(f"Unknown scraper type: {scraper_type}")
         return cls._scrapers[scraper_type]()
+    
+    @classmethod
+    def shutdown(cls) -> None:
+        """Release shared resources (e.g. pooled browsers) of all registered scrapers."""
+        for name, scraper_class in cls._scrapers.items():
+            try:
+                scraper_class.shutdown()
+            except Exception as e:
+                logger.error(f"Error shutting down scraper {name}: {e}")
 
 # Register available scrapers
-ScraperFactory.register("bandisintown", BandsInTownScraper) 
\ No newline at end of file
+ScraperFactory.register("bandisintown", BandsInTownScraper)
+ScraperFactory.register("website", WebsiteScraper) 
\ No newline at end of file
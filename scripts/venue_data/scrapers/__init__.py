@@ -1,4 +1,6 @@
 from .base import VenueScraper
 from .bandisintown import BandsInTownScraper
+from .website import WebsiteScraper
+from .driver_pool import DriverPool
 
-__all__ = ['VenueScraper', 'BandsInTownScraper'] 
\ No newline at end of file
+__all__ = ['VenueScraper', 'BandsInTownScraper', 'WebsiteScraper', 'DriverPool'] 
@@ -1,70 +1,50 @@
 import os
 import logging
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from pathlib import Path
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from .base import VenueScraper
+from .driver_pool import DriverPool, get_driver_pool, close_driver_pool, LEAN_BROWSER
+from .json_ld import extract_json_ld_blocks, parse_music_events, events_from_items, MUSIC_EVENTS_SCRIPT
 from ..models import ArtistEvent
+from ..constants import HTTP_TIMEOUT
+from ..rate_limit import get_host_limiter
 import time
 import random
-import json
 
 logger = logging.getLogger(__name__)
 logger.setLevel(os.environ.get('LOGLEVEL', 'INFO').upper())
 
+JSON_LD_SELECTOR = 'script[type="application/ld+json"]'
+
+# Seconds to wait for JSON-LD scripts after the DOM is ready
+PAGE_WAIT_TIMEOUT = 10
+
+# Try reading JSON-LD from plain HTTP before launching Chrome
+FAST_MODE = os.environ.get('BANDSINTOWN_FAST_MODE', 'true').lower() not in ('0', 'false', 'no')
+
 class BandsInTownScraper(VenueScraper):
     """Scraper for BandsInTown venue pages."""
     
-    def __init__(self):
+    def __init__(self, driver_pool: Optional[DriverPool] = None, fast_mode: bool = FAST_MODE):
         super().__init__()
-        self.setup_driver()
+        self.driver_pool = driver_pool or get_driver_pool()
+        self.fast_mode = fast_mode
+        self.driver = None
+        self.last_page_load_time = None
     
-    def setup_driver(self):
-        """Setup Chrome driver with proper options."""
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        
-        # Add anti-bot detection evasion
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        try:
-            self.driver = webdriver.Chrome(options=options)
-            # Execute CDP commands to prevent detection
-            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    })
-                '''
-            })
-            logger.info("Chrome driver initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize Chrome driver: {e}")
-            raise
-    
-    def __del__(self):
-        """Clean up resources."""
-        self.cleanup()
+    @classmethod
+    def shutdown(cls):
+        """Quit the shared Chrome drivers at the end of a run."""
+        close_driver_pool()
     
     def cleanup(self):
-        """Clean up browser resources safely."""
-        if hasattr(self, 'driver'):
-            try:
-                self.driver.quit()
-                logger.debug("Chrome driver cleaned up successfully")
-            except Exception as e:
-                logger.error(f"Error cleaning up Chrome driver: {e}")
+        """Drop this scraper's hold on its browser; the shared pool stays up for other scrapers."""
+        self.driver = None
     
     @property
     def scraper_type(self) -> str:
@@ -83,49 +63,65 @@ class BandsInTownScraper(VenueScraper):
             logger.error(f"Failed to save screenshot: {e}")
     
     def get_events(self, venue_key: str, venue_info: dict) -> List[ArtistEvent]:
-        """Get events from BandsInTown using JSON-LD data."""
+        """Get events from BandsInTown, rendering the page only if plain HTTP finds none."""
+        if self.fast_mode:
+            events = self._fetch_events(venue_key, venue_info)
+            if events:
+                return events
+            logger.info(f"No MusicEvents in server-rendered HTML for {venue_key}, falling back to browser")
+        
+        with self.driver_pool.lease() as driver:
+            self.driver = driver
+            try:
+                return self._scrape_events(venue_key, venue_info)
+            finally:
+                self.driver = None
+    
+    def _fetch_events(self, venue_key: str, venue_info: dict) -> List[ArtistEvent]:
+        """Read JSON-LD events straight from the server-rendered HTML."""
+        url = venue_info['scrapers'][self.scraper_type]['url']
+        try:
+            with get_host_limiter().limit(url):
+                # Time only the request, not the wait for a per-host slot
+                start = time.perf_counter()
+                response = self.session.get(url, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            events = parse_music_events(extract_json_ld_blocks(response.content), venue_info['name'])
+            logger.info(f"Found {len(events)} events for {venue_key} over HTTP in {time.perf_counter() - start:.2f}s")
+            return events
+        except Exception as e:
+            logger.warning(f"HTTP fetch failed for {venue_key}: {e}")
+            return []
+    
+    def _scrape_events(self, venue_key: str, venue_info: dict) -> List[ArtistEvent]:
+        """Scrape events from the venue page using JSON-LD data."""
         try:
             url = venue_info['scrapers'][self.scraper_type]['url']
             logger.info(f"Fetching events for {venue_key} from {url}")
             
-            # Load the page
-            self.driver.get(url)
-            
+            # Load the page and wait only until the JSON-LD scripts exist
+            with get_host_limiter().limit(url):
+                # Time only the page load, not the wait for a per-host slot
+                start = time.perf_counter()
+                self.driver.get(url)
             try:
-                # Find all script tags with type="application/ld+json"
-                script_elements = self.driver.find_elements(
-                    By.CSS_SELECTOR, 
-                    'script[type="application/ld+json"]'
+                WebDriverWait(self.driver, PAGE_WAIT_TIMEOUT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, JSON_LD_SELECTOR))
                 )
+            except TimeoutException:
+                logger.warning(f"No JSON-LD appeared for {venue_key} within {PAGE_WAIT_TIMEOUT}s")
+            self.last_page_load_time = time.perf_counter() - start
+            logger.info(f"Page loaded for {venue_key} in {self.last_page_load_time:.2f}s "
+                        f"({'lean' if LEAN_BROWSER else 'full'} browser)")
+            
+            try:
+                # Parse all JSON-LD scripts in the page with one WebDriver call
+                result = self.driver.execute_script(MUSIC_EVENTS_SCRIPT)
+                for error in result['errors']:
+                    logger.warning(f"Error decoding JSON from script tag: {error}")
+                logger.debug(f"Read {len(result['events'])} MusicEvents from {result['scripts']} JSON-LD scripts")
                 
-                events = []
-                for script in script_elements:
-                    try:
-                        # Parse JSON content
-                        json_content = json.loads(script.get_attribute('innerHTML'))
-                        
-                        # If it's an array, check each item
-                        if isinstance(json_content, list):
-                            for item in json_content:
-                                if item.get('@type') == 'MusicEvent':
-                                    try:
-                                        # Extract event info
-                                        artist = item['performer']['name']
-                                        date_str = item['startDate']
-                                        date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                                        
-                                        events.append(ArtistEvent(
-                                            name=artist,
-                                            date=date,
-                                            venue=venue_info['name']
-                                        ))
-                                        logger.debug(f"Found event: {artist} on {date}")
-                                    except Exception as e:
-                                        logger.warning(f"Error parsing event data: {e}")
-                                        continue
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Error decoding JSON from script tag: {e}")
-                        continue
+                events = events_from_items(result['events'], venue_info['name'])
                 
                 if not events:
                     logger.warning(f"No events found for {venue_key}, saving screenshot")
@@ -2,9 +2,10 @@ from abc import ABC, abstractmethod
 from typing import List
 import logging
 import requests
-from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 from ..models import ArtistEvent
+from ..constants import HTTP_HEADERS
+from ..http_cache import CachingHTTPAdapter, get_http_cache
 
 logger = logging.getLogger(__name__)
 
@@ -15,15 +16,17 @@ class VenueScraper(ABC):
         self.session = self._create_session()
     
     def _create_session(self) -> requests.Session:
-        """Create a requests session with retries."""
+        """Create a requests session with retries and a conditional-request cache."""
         session = requests.Session()
         retries = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[500, 502, 503, 504]
         )
-        session.mount('http://', HTTPAdapter(max_retries=retries))
-        session.mount('https://', HTTPAdapter(max_retries=retries))
+        adapter = CachingHTTPAdapter(get_http_cache(), max_retries=retries)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(HTTP_HEADERS)
         return session
     
     @property
@@ -35,4 +38,9 @@ class VenueScraper(ABC):
     @abstractmethod
     def get_events(self, venue_key: str, venue_info: dict) -> List[ArtistEvent]:
         """Get all events for a venue."""
-        pass
\ No newline at end of file
+        pass
+    
+    @classmethod
+    def shutdown(cls) -> None:
+        """Release resources shared by all instances at the end of a run."""
+        pass
@@ -0,0 +1,227 @@
+import os
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+import psutil
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+# Recycle a driver after this many page loads or once Chrome's RSS passes this many MB
+DEFAULT_MAX_PAGES = int(os.environ.get('DRIVER_MAX_PAGES', 50))
+DEFAULT_MAX_RSS_MB = int(os.environ.get('DRIVER_MAX_RSS_MB', 1024))
+
+# Block resources that aren't needed to read JSON-LD
+LEAN_BROWSER = os.environ.get('LEAN_BROWSER', 'true').lower() not in ('0', 'false', 'no')
+BLOCKED_URL_PATTERNS = [
+    # Images and media
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico', '*.mp4', '*.webm',
+    # Fonts and stylesheets
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot', '*.css',
+    # Analytics and ad trackers
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googlesyndication.com*',
+    '*facebook.net*', '*connect.facebook.com*', '*hotjar.com*', '*segment.io*', '*segment.com*',
+    '*amplitude.com*', '*branch.io*', '*sentry.io*', '*newrelic.com*', '*nr-data.net*'
+]
+
+def create_chrome_driver(lean: bool = LEAN_BROWSER) -> webdriver.Chrome:
+    """Launch a headless Chrome driver with proper options.
+
+    In lean mode the driver uses the eager page-load strategy and blocks
+    images, fonts, stylesheets and tracking scripts, none of which are
+    needed to read a page's JSON-LD.
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+
+    # Add anti-bot detection evasion
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+
+    if lean:
+        # Return from get() once the DOM is parsed instead of waiting for every subresource
+        options.page_load_strategy = 'eager'
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2
+        })
+
+    try:
+        driver = webdriver.Chrome(options=options)
+        if lean:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        # Execute CDP commands to prevent detection
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            'source': '''
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                })
+            '''
+        })
+        logger.info("Chrome driver initialized successfully")
+        return driver
+    except Exception as e:
+        logger.error(f"Failed to initialize Chrome driver: {e}")
+        raise
+
+def driver_rss_mb(driver) -> Optional[float]:
+    """Return the combined RSS in MB of a driver's process tree, if it can be measured."""
+    try:
+        process = psutil.Process(driver.service.process.pid)
+        processes = [process] + process.children(recursive=True)
+    except (AttributeError, psutil.Error):
+        return None
+
+    rss = 0
+    for proc in processes:
+        try:
+            rss += proc.memory_info().rss
+        except psutil.Error:
+            continue
+    return rss / (1024 * 1024)
+
+class DriverPool:
+    """Pool of warm WebDriver instances shared across venues in a run.
+
+    Drivers are launched lazily, handed out with ``lease()`` and recycled
+    after ``max_pages`` page loads or once their process tree grows past
+    ``max_rss_mb``. Call ``close()`` at the end of a run to quit them.
+    """
+
+    def __init__(self, driver_factory: Callable = create_chrome_driver, size: int = 1,
+                 max_pages: int = DEFAULT_MAX_PAGES, max_rss_mb: Optional[int] = DEFAULT_MAX_RSS_MB):
+        self.driver_factory = driver_factory
+        self.size = size
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self._idle: List = []
+        self._pages: Dict[int, int] = {}
+        self._leased = 0
+        self._closed_generation = 0
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Condition()
+
+    @contextmanager
+    def lease(self):
+        """Borrow a driver for the duration of a ``with`` block."""
+        driver = self.acquire()
+        try:
+            yield driver
+        except WebDriverException:
+            # A broken browser shouldn't be handed to the next venue
+            self.release(driver, discard=True)
+            raise
+        except BaseException:
+            self.release(driver)
+            raise
+        else:
+            self.release(driver)
+
+    def acquire(self):
+        """Take an idle driver, launching a new one if the pool has room."""
+        with self._lock:
+            while not self._idle and self._leased >= self.size:
+                self._lock.wait()
+            self._leased += 1
+            if self._idle:
+                return self._idle.pop()
+
+        try:
+            driver = self.driver_factory()
+        except Exception:
+            with self._lock:
+                self._leased -= 1
+                self._lock.notify()
+            raise
+
+        with self._lock:
+            self._pages[id(driver)] = 0
+            self._generations[id(driver)] = self._closed_generation
+        return driver
+
+    def release(self, driver, discard: bool = False) -> None:
+        """Return a driver to the pool, recycling it if it is worn out."""
+        with self._lock:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+            pages = self._pages[id(driver)]
+            stale = self._generations.get(id(driver)) != self._closed_generation
+
+        reason = None
+        if discard:
+            reason = "driver error"
+        elif stale:
+            reason = "pool closed"
+        elif self.max_pages and pages >= self.max_pages:
+            reason = f"served {pages} pages"
+        elif self.max_rss_mb:
+            rss = driver_rss_mb(driver)
+            if rss is not None and rss > self.max_rss_mb:
+                reason = f"RSS {rss:.0f}MB over {self.max_rss_mb}MB limit"
+
+        if reason:
+            logger.info(f"Recycling Chrome driver ({reason})")
+            self._quit(driver)
+
+        with self._lock:
+            self._leased -= 1
+            if not reason:
+                self._idle.append(driver)
+            self._lock.notify()
+
+    def resize(self, size: int) -> None:
+        """Change how many drivers may be leased at once."""
+        with self._lock:
+            self.size = size
+            self._lock.notify_all()
+
+    def close(self) -> None:
+        """Quit all idle drivers; leased drivers are quit when they are released."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._closed_generation += 1
+
+        for driver in idle:
+            self._quit(driver)
+        if idle:
+            logger.info(f"Closed {len(idle)} pooled Chrome driver(s)")
+
+    def _quit(self, driver) -> None:
+        """Quit a driver and forget its bookkeeping."""
+        with self._lock:
+            self._pages.pop(id(driver), None)
+            self._generations.pop(id(driver), None)
+        try:
+            driver.quit()
+            logger.debug("Chrome driver cleaned up successfully")
+        except Exception as e:
+            logger.error(f"Error cleaning up Chrome driver: {e}")
+
+_shared_pool: Optional[DriverPool] = None
+_shared_pool_lock = threading.Lock()
+
+def get_driver_pool() -> DriverPool:
+    """Return the process-wide driver pool, creating it on first use."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = DriverPool()
+        return _shared_pool
+
+def close_driver_pool() -> None:
+    """Quit every driver in the process-wide pool."""
+    with _shared_pool_lock:
+        pool = _shared_pool
+    if pool is not None:
+        pool.close()
+
+# Quit pooled browsers once when the process exits, however the run ended
+atexit.register(close_driver_pool)
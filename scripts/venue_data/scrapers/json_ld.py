@@ -0,0 +1,100 @@
+import re
+import json
+import logging
+from datetime import datetime
+from typing import Iterable, List
+from ..models import ArtistEvent
+
+logger = logging.getLogger(__name__)
+
+# Matches <script type="application/ld+json"> blocks in raw (undecoded) HTML
+JSON_LD_PATTERN = re.compile(
+    rb'<script\b[^>]*\btype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Runs in the browser: parse every JSON-LD script and return only the MusicEvent
+# items, so the page is read in a single WebDriver round trip
+MUSIC_EVENTS_SCRIPT = """
+const result = {scripts: 0, events: [], errors: []};
+for (const script of document.querySelectorAll('script[type="application/ld+json"]')) {
+    result.scripts += 1;
+    let content;
+    try {
+        content = JSON.parse(script.textContent);
+    } catch (e) {
+        result.errors.push(String(e));
+        continue;
+    }
+    if (content && !Array.isArray(content)) {
+        content = content['@graph'] || [content];
+    }
+    for (const item of Array.isArray(content) ? content : []) {
+        const type = item && item['@type'];
+        if (type === 'MusicEvent' || (Array.isArray(type) && type.includes('MusicEvent'))) {
+            result.events.push(item);
+        }
+    }
+}
+return result;
+"""
+
+def extract_json_ld_blocks(html: bytes) -> List[str]:
+    """Pull the JSON-LD script payloads out of raw page bytes."""
+    blocks = []
+    for match in JSON_LD_PATTERN.finditer(html):
+        payload = match.group(1).strip()
+        if payload:
+            blocks.append(payload.decode('utf-8', errors='replace'))
+    return blocks
+
+def iter_json_ld_items(blocks: Iterable[str]) -> Iterable[dict]:
+    """Decode JSON-LD payloads and yield every top-level item they contain."""
+    for block in blocks:
+        try:
+            content = json.loads(block)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Error decoding JSON from script tag: {e}")
+            continue
+
+        if isinstance(content, dict):
+            content = content.get('@graph', [content])
+        if not isinstance(content, list):
+            continue
+        for item in content:
+            if isinstance(item, dict):
+                yield item
+
+def is_music_event(item: dict) -> bool:
+    """Check whether a JSON-LD item describes a MusicEvent."""
+    item_type = item.get('@type')
+    if isinstance(item_type, list):
+        return 'MusicEvent' in item_type
+    return item_type == 'MusicEvent'
+
+def events_from_items(items: Iterable[dict], venue_name: str) -> List[ArtistEvent]:
+    """Build ArtistEvents from JSON-LD MusicEvent items."""
+    rows = []
+    for item in items:
+        if not is_music_event(item):
+            continue
+        try:
+            # Extract event info
+            performer = item['performer']
+            if isinstance(performer, list):
+                performer = performer[0]
+            artist = str(performer['name']).strip()
+            date_str = item['startDate']
+            date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+
+            rows.append((artist, date))
+            logger.debug(f"Found event: {artist} on {date}")
+        except Exception as e:
+            logger.warning(f"Error parsing event data: {e}")
+            continue
+    # Fields are already cleaned above, so skip per-event revalidation
+    return ArtistEvent.bulk(rows, str(venue_name).strip())
+
+def parse_music_events(blocks: Iterable[str], venue_name: str) -> List[ArtistEvent]:
+    """Build ArtistEvents from raw JSON-LD payloads."""
+    return events_from_items(iter_json_ld_items(blocks), venue_name)
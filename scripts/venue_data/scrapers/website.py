@@ -0,0 +1,35 @@
+import os
+import logging
+from typing import List
+from .base import VenueScraper
+from ..models import ArtistEvent
+from ..constants import HTTP_TIMEOUT
+from ..event_extraction import CalendarEventExtractor
+from ..rate_limit import get_host_limiter
+from ..scraper import clean_calendar_text
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.environ.get('LOGLEVEL', 'INFO').upper())
+
+class WebsiteScraper(VenueScraper):
+    """Scraper for a venue's own calendar page, parsed as plain text."""
+
+    def __init__(self, extractor: CalendarEventExtractor = None):
+        super().__init__()
+        self.extractor = extractor or CalendarEventExtractor()
+
+    @property
+    def scraper_type(self) -> str:
+        return "website"
+
+    def get_events(self, venue_key: str, venue_info: dict) -> List[ArtistEvent]:
+        """Fetch the calendar page and extract its events, locally where possible."""
+        url = venue_info['scrapers'][self.scraper_type]['url']
+        logger.info(f"Fetching calendar for {venue_key} from {url}")
+        with get_host_limiter().limit(url):
+            response = self.session.get(url, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+
+        events = self.extractor.extract(clean_calendar_text(response.text), venue_info['name'])
+        logger.info(f"Found {len(events)} events for {venue_key}")
+        return events
@@ -1,15 +1,55 @@
 import yaml
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Tuple
+import hashlib
 import os
+import threading
 from pathlib import Path
 import logging
 from .models import ArtistEvent
+from .db import get_event_store, city_from_path
+from .yaml_cache import load_yaml
+from .manifest import load_manifest, record_artists, stale_reason, update_manifest, content_hash
 
 logger = logging.getLogger(__name__)
 
-def save_artists_to_file(venue_name: str, artist_events: List[ArtistEvent], month: str, output_dir: str = "data/venue-data/sf") -> str:
-    """Save artists to a YAML file with timestamp in venue-specific directory."""
+# Per-venue file holding the hash of the last extracted event set
+EVENTS_HASH_FILE = ".events_hash"
+
+# Bookkeeping fields that don't count as a content change
+VOLATILE_FIELDS = ("updated", "created")
+
+def _content(data: dict, ignore: Tuple[str, ...]) -> dict:
+    return {key: value for key, value in data.items() if key not in ignore}
+
+def write_yaml_if_changed(path, data: dict, ignore: Tuple[str, ...] = VOLATILE_FIELDS) -> bool:
+    """Atomically write data as YAML unless the file already holds the same content.
+    
+    Fields in ``ignore`` (timestamps) are left out of the comparison, so an
+    unchanged file keeps its old timestamps and mtime. Returns whether it wrote.
+    """
+    path = Path(path)
+    try:
+        existing = load_yaml(path)
+    except (OSError, yaml.YAMLError):
+        existing = None
+    if isinstance(existing, dict) and _content(existing, ignore) == _content(data, ignore):
+        return False
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return True
+
+def save_artists_if_changed(venue_name: str, artist_events: List[ArtistEvent], month: str,
+                            output_dir: str = "data/venue-data/sf") -> Tuple[str, bool]:
+    """Save a venue-month's artists unless unchanged; returns (filename, whether it changed)."""
     venue_dir = get_venue_output_dir(venue_name, output_dir)
     filename = f"{venue_dir}/artists_{month}.yaml"
     
@@ -28,20 +68,53 @@ def save_artists_to_file(venue_name: str, artist_events: List[ArtistEvent], mont
         "updated": datetime.now().isoformat()
     }
     
-    with open(filename, 'w') as f:
-        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+    if not write_yaml_if_changed(filename, data):
+        logger.info(f"Artists unchanged in {filename}")
+        return filename, False
+    
+    record_artists(output_dir, venue_name, month, data["artists"], data["updated"])
+    store = get_event_store()
+    if store:
+        store.save_artists(city_from_path(output_dir), venue_name, month, data["artists"], data["updated"])
     
     logger.info(f"Saved {len(unique_events)} unique artists to {filename}")
+    return filename, True
+
+def save_artists_to_file(venue_name: str, artist_events: List[ArtistEvent], month: str, output_dir: str = "data/venue-data/sf") -> str:
+    """Save artists to a YAML file with timestamp in venue-specific directory."""
+    filename, _ = save_artists_if_changed(venue_name, artist_events, month, output_dir)
     return filename
 
+def compute_events_hash(artist_events: List[ArtistEvent], months: List[str]) -> str:
+    """Hash the normalized set of (name, date) pairs plus the months they were bucketed into."""
+    digest = hashlib.sha256()
+    for month in months:
+        digest.update(f"{month}\n".encode('utf-8'))
+    for name, date in sorted({(event.name, event.date.strftime('%Y-%m-%d')) for event in artist_events}):
+        digest.update(f"{name}\t{date}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def load_events_hash(venue_key: str, output_dir: str = "data/venue-data/sf") -> Optional[str]:
+    """Load the events hash recorded by the venue's last run, if any."""
+    hash_file = Path(output_dir) / venue_key / EVENTS_HASH_FILE
+    try:
+        return hash_file.read_text().strip() or None
+    except OSError:
+        return None
+
+def save_events_hash(venue_key: str, events_hash: str, output_dir: str = "data/venue-data/sf") -> None:
+    """Record the events hash for the venue's current run."""
+    venue_dir = get_venue_output_dir(venue_key, output_dir)
+    with open(Path(venue_dir) / EVENTS_HASH_FILE, 'w') as f:
+        f.write(events_hash + "\n")
+
 def load_venue_config(config_path: str = None) -> dict:
     """Load venue configuration with validation."""
     if config_path is None:
         config_path = "data/venue-data/sf/venues.yaml"
         
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_yaml(config_path)
             
         if not isinstance(config, dict):
             raise ValueError("Invalid config format - expected dictionary")
@@ -64,20 +137,60 @@ def get_venue_output_dir(venue_key: str, base_dir: str = "data/venue-data/sf") -
 
 def needs_update(venue_key: str, month: str, output_dir: str) -> bool:
     """Check if venue data needs to be updated (older than 24 hours)."""
+    store = get_event_store()
+    if store:
+        artists_updated, playlist_created = store.freshness(city_from_path(output_dir), venue_key, month)
+        # Venue-months saved before the store existed fall through to the files
+        if artists_updated:
+            if not playlist_created:
+                return True
+            playlist_time = datetime.fromisoformat(playlist_created)
+            if datetime.fromisoformat(artists_updated) > playlist_time:
+                return True
+            return (datetime.now() - playlist_time).days >= 1
+    
+    # The city manifest answers with one cached read; data written before it existed seeds it once
+    entry = load_manifest(output_dir).get(venue_key, {}).get(month)
+    if not entry or not entry.get('artists_updated'):
+        entry = _seed_manifest_entry(venue_key, month, output_dir)
+    return stale_reason(entry) is not None
+
+def _timestamp(value) -> str:
+    """ISO timestamp from a YAML value, which may have been loaded as a datetime."""
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+def _seed_manifest_entry(venue_key: str, month: str, output_dir: str) -> Optional[dict]:
+    """Record a venue-month's manifest entry from its artist and playlist YAML; None if it has no artists."""
     artist_file = Path(output_dir) / venue_key / f"artists_{month}.yaml"
     playlist_file = Path(output_dir) / venue_key / f"playlist_{month}.yaml"
+    try:
+        artists_data = load_yaml(artist_file)
+        artists_mtime = artist_file.stat().st_mtime
+    except (OSError, yaml.YAMLError):
+        return None
+    if not isinstance(artists_data, dict):
+        return None
     
-    if artist_file.exists() and not playlist_file.exists():
-        return True
-        
-    if playlist_file.exists():
-        playlist_time = datetime.fromtimestamp(playlist_file.stat().st_mtime)
-        artist_time = datetime.fromtimestamp(artist_file.stat().st_mtime)
-        
-        if artist_time > playlist_time:
-            return True
-            
-        time_since_update = datetime.now() - playlist_time
-        return time_since_update.days >= 1
-        
-    return True
\ No newline at end of file
+    fields = {
+        'artists_updated': _timestamp(artists_data.get('updated') or datetime.fromtimestamp(artists_mtime)),
+        'artists_hash': content_hash(artists_data.get('artists', []))
+    }
+    entry = load_manifest(output_dir).get(venue_key, {}).get(month, {})
+    playlist_created = entry.get('playlist_created')
+    if not playlist_created:
+        try:
+            playlist_data = load_yaml(playlist_file)
+        except (OSError, yaml.YAMLError):
+            playlist_data = None
+        if isinstance(playlist_data, dict) and playlist_data.get('created'):
+            playlist_created = _timestamp(playlist_data['created'])
+            fields['playlist_created'] = playlist_created
+            fields['playlist_hash'] = content_hash(playlist_data.get('playlist_url'))
+    if playlist_created:
+        # A playlist made after the artists were saved was built from them
+        newer = datetime.fromisoformat(playlist_created) >= datetime.fromisoformat(fields['artists_updated'])
+        fields['playlist_artists_hash'] = fields['artists_hash'] if newer else None
+    
+    update_manifest(output_dir, venue_key, month, **fields)
+    logger.info(f"Seeded manifest for {venue_key} {month} from existing files")
+    return {**entry, **fields}
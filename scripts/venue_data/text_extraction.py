@@ -0,0 +1,160 @@
+import os
+import logging
+from html.parser import HTMLParser
+from typing import Callable, Dict, List
+from bs4 import BeautifulSoup
+from bs4.builder import HTMLTreeBuilder
+from bs4.dammit import EntitySubstitution
+
+logger = logging.getLogger(__name__)
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+SKIPPED_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+# Elements whose whitespace-only strings are kept verbatim
+PRESERVE_WHITESPACE_TAGS = frozenset(['pre', 'textarea'])
+
+# Elements that never have content
+VOID_TAGS = HTMLTreeBuilder.empty_element_tags
+
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+
+def bs4_text(html: str) -> str:
+    """Extract text by building a full BeautifulSoup tree."""
+    soup = BeautifulSoup(html, 'html.parser')
+    # Remove script and style elements
+    for element in soup(['script', 'style']):
+        element.decompose()
+    return soup.get_text()
+
+class _TextCollector(HTMLParser):
+    """Tokenizer that keeps text nodes the way BeautifulSoup's get_text() would."""
+
+    def __init__(self):
+        # Entities are resolved here, exactly as BeautifulSoup's parser does it
+        super().__init__(convert_charrefs=False)
+        self.parts: List[str] = []
+        self._pending: List[str] = []
+        self._open_tags: List[str] = []
+        self._skip_depth = 0
+        self._preserve_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in VOID_TAGS:
+            return
+        self._open_tags.append(tag)
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in PRESERVE_WHITESPACE_TAGS:
+            self._preserve_depth += 1
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag not in self._open_tags:
+            return
+        # Like the tree builder, an end tag also closes anything still open inside it
+        while self._open_tags:
+            closed = self._open_tags.pop()
+            if closed in SKIPPED_TAGS:
+                self._skip_depth -= 1
+            elif closed in PRESERVE_WHITESPACE_TAGS:
+                self._preserve_depth -= 1
+            if closed == tag:
+                break
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self._pending.append(data)
+
+    def handle_charref(self, name):
+        if name[:1] in ('x', 'X'):
+            codepoint = int(name.lstrip('xX'), 16)
+        else:
+            codepoint = int(name)
+
+        data = None
+        if codepoint < 256:
+            # Numeric references in this range often mean windows-1252
+            try:
+                data = bytes([codepoint]).decode('windows-1252')
+            except UnicodeDecodeError:
+                pass
+        if not data:
+            try:
+                data = chr(codepoint)
+            except (ValueError, OverflowError):
+                pass
+        self.handle_data(data or '\N{REPLACEMENT CHARACTER}')
+
+    def handle_entityref(self, name):
+        character = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name)
+        self.handle_data(character if character is not None else f"&{name}")
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def unknown_decl(self, data):
+        self._flush()
+        # CDATA sections are kept even inside otherwise skipped elements
+        if data.upper().startswith('CDATA['):
+            self._pending.append(data[len('CDATA['):])
+            self._flush()
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def _flush(self):
+        """Emit the text gathered since the last tag, collapsing blank runs like BeautifulSoup."""
+        if not self._pending:
+            return
+        data = ''.join(self._pending)
+        self._pending = []
+        if not self._preserve_depth and not data.strip(ASCII_SPACES):
+            data = '\n' if '\n' in data else ' '
+        self.parts.append(data)
+
+def stream_text(html: str) -> str:
+    """Extract text in one streaming pass of the stdlib tokenizer, without building a tree."""
+    collector = _TextCollector()
+    collector.feed(html)
+    collector.close()
+    return ''.join(collector.parts)
+
+def lxml_text(html: str) -> str:
+    """Extract text with lxml's C parser.
+
+    Fastest backend, but lxml is optional and its handling of whitespace and
+    malformed markup can differ slightly from BeautifulSoup's.
+    """
+    from lxml import html as lxml_html
+    from lxml.etree import strip_elements
+    root = lxml_html.fromstring(html)
+    strip_elements(root, *SKIPPED_TAGS, with_tail=False)
+    return root.text_content()
+
+TEXT_ENGINES: Dict[str, Callable[[str], str]] = {
+    'stream': stream_text,
+    'bs4': bs4_text,
+    'lxml': lxml_text,
+}
+
+# Engine used by clean_calendar_text when none is given
+DEFAULT_TEXT_ENGINE = os.environ.get('TEXT_ENGINE', 'stream')
+
+def extract_text(html: str, engine: str = None) -> str:
+    """Extract visible text from HTML with the named engine."""
+    engine = engine or DEFAULT_TEXT_ENGINE
+    if engine not in TEXT_ENGINES:
+        raise ValueError(f"Unknown text engine: {engine}")
+    return TEXT_ENGINES[engine](html)
@@ -1,45 +1,122 @@
+import logging
 import tiktoken
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List, Optional
 from datetime import datetime, timedelta
+from .constants import MESSAGE_PREFIX, RESPONSE_TOKEN_ESTIMATE
+
+logger = logging.getLogger(__name__)
 
 # OpenAI's context window size for gpt-3.5-turbo
 TOKEN_LIMIT = 4000 
 
-def chunk_message(text: str, max_length: int = 2000) -> List[str]:
-    """Split text into chunks of max_length, trying to break at sentence boundaries."""
+# Context window sizes per model
+MODEL_TOKEN_LIMITS = {
+    "gpt-3.5-turbo": TOKEN_LIMIT,
+    "gpt-4": 8000,
+    "gpt-4o-mini": 16000,
+}
+
+# Chunk break points, best tier first; within a tier the latest break wins
+SPLIT_POINTS = [('. ', '! ', '? '), ('\n',), (', ',), (' ',)]
+
+# Rough characters per token when tiktoken isn't available
+CHARS_PER_TOKEN = 4
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str = "gpt-3.5-turbo"):
+    """Return the tiktoken encoding for a model, or None if it can't be loaded (e.g. offline)."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception as e:
+        logger.warning(f"Could not load tiktoken encoding for {model}, estimating tokens: {e}")
+        return None
+
+def count_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
+    """Count the tokens a model sees for text, estimating ~4 characters per token without tiktoken."""
+    encoding = get_encoding(model)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+def chunk_token_budget(model: str = "gpt-3.5-turbo") -> int:
+    """Tokens of calendar text that fit in one request, leaving room for the prompt and the answer."""
+    limit = MODEL_TOKEN_LIMITS.get(model, TOKEN_LIMIT)
+    return limit - count_tokens(MESSAGE_PREFIX, model) - RESPONSE_TOKEN_ESTIMATE
+
+def iter_chunks(text: str, max_length: int = 2000, max_tokens: Optional[int] = None,
+                model: str = "gpt-3.5-turbo") -> Iterator[str]:
+    """Yield chunks of text, trying to break at sentence boundaries.
+    
+    Chunks hold at most ``max_length`` characters, or at most ``max_tokens``
+    tokens for ``model`` when a token budget is given. The text is walked
+    once by index, so large pages are chunked in linear time.
+    """
     if not text:
-        return []
-        
-    # If text is shorter than max_length, return it as is
-    if len(text) <= max_length:
-        return [text]
+        return
     
-    chunks = []
-    while text:
-        if len(text) <= max_length:
-            chunks.append(text)
-            break
-            
-        # Try to find a sentence break near the max_length
-        split_point = text.rfind('. ', 0, max_length)
+    token_offsets = _token_offsets(text, model) if max_tokens else None
+    token_index = 0
+    pos = 0
+    text_length = len(text)
+    while True:
+        # Skip whitespace between chunks
+        while pos < text_length and text[pos].isspace():
+            pos += 1
+        if pos >= text_length:
+            return
         
-        if split_point == -1:
-            # No sentence break found, try other punctuation
-            for punct in ['! ', '? ', '\n', '. ', ', ']:
-                split_point = text.rfind(punct, 0, max_length)
-                if split_point != -1:
-                    break
-            
-            if split_point == -1:
-                # No good break found, force split at max_length
-                split_point = max_length
+        # Furthest end allowed by the budget
+        if token_offsets is not None:
+            while token_index < len(token_offsets) and token_offsets[token_index] < pos:
+                token_index += 1
+            budget_index = token_index + max_tokens
+            limit = token_offsets[budget_index] if budget_index < len(token_offsets) else text_length
+        elif max_tokens:
+            limit = pos + max_tokens * CHARS_PER_TOKEN
         else:
-            split_point += 2  # Include the period and space
+            limit = pos + max_length
         
-        chunks.append(text[:split_point].strip())
-        text = text[split_point:].strip()
-    
-    return chunks
+        if limit >= text_length:
+            chunk = text[pos:].strip()
+            if chunk:
+                yield chunk
+            return
+        
+        # Prefer sentence breaks, then other punctuation, then words
+        split_point = -1
+        for tier in SPLIT_POINTS:
+            for punct in tier:
+                found = text.rfind(punct, pos, limit)
+                if found > pos:
+                    split_point = max(split_point, found + len(punct))
+            if split_point != -1:
+                break
+        if split_point == -1:
+            # No good break found, force split at the budget
+            split_point = max(limit, pos + 1)
+        
+        chunk = text[pos:split_point].strip()
+        if chunk:
+            yield chunk
+        pos = split_point
+
+def chunk_message(text: str, max_length: int = 2000, max_tokens: Optional[int] = None,
+                  model: str = "gpt-3.5-turbo") -> List[str]:
+    """Split text into chunks of max_length (or max_tokens), trying to break at sentence boundaries."""
+    return list(iter_chunks(text, max_length, max_tokens, model))
+
+def _token_offsets(text: str, model: str) -> Optional[List[int]]:
+    """Character offset of each token in text, or None to fall back to estimating."""
+    encoding = get_encoding(model)
+    if encoding is None:
+        return None
+    try:
+        _, offsets = encoding.decode_with_offsets(encoding.encode(text, disallowed_special=()))
+        return offsets
+    except Exception as e:
+        logger.warning(f"Could not tokenize text, estimating tokens: {e}")
+        return None
 
 def get_next_months(num_months: int = 3) -> List[str]:
     """Get list of next N months in format 'Month_YYYY'."""
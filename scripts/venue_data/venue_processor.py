@@ -2,12 +2,20 @@ import os
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
-from .storage import load_venue_config, save_artists_to_file
+from typing import List, Dict, Optional
+from .storage import (
+    load_venue_config,
+    save_artists_if_changed,
+    compute_events_hash,
+    load_events_hash,
+    save_events_hash
+)
 from .text_utils import get_next_months, chunk_message
 from .scraper import fetch_venue_page, clean_calendar_text
 from .artist_extractor import ArtistExtractor
 from .scraper_factory import ScraperFactory
+from .event_index import EventIndex, parse_month
+from .db import get_event_store, city_from_path
 
 logger = logging.getLogger(__name__)
 
@@ -15,11 +23,17 @@ logger = logging.getLogger(__name__)
 log_level = os.environ.get('LOGLEVEL', 'INFO').upper()
 logger.setLevel(log_level)
 
-def process_venue(venue_key: str, output_dir: str = "data/venue-data/sf", force: bool = False) -> List[str]:
-    """Process a venue and save its events."""
+def process_venue(venue_key: str, output_dir: str = "data/venue-data/sf", force: bool = False,
+                  venues: Optional[Dict[str, dict]] = None,
+                  changed_months: Optional[List[str]] = None) -> List[str]:
+    """Process a venue and save its events.
+    
+    ``venues`` is the already loaded venue config; it is loaded here when not given.
+    Months whose artist files actually changed are appended to ``changed_months``.
+    """
     try:
-        # Load venue config with new structure - get just the venues dict
-        venues = load_venue_config()  # This now returns just the venues dictionary
+        if venues is None:
+            venues = load_venue_config()  # Returns just the venues dictionary
         
         if venue_key not in venues:
             logger.error(f"Venue '{venue_key}' not found in config")
@@ -27,10 +41,9 @@ def process_venue(venue_key: str, output_dir: str = "data/venue-data/sf", force:
             
         venue_info = venues[venue_key]
         
-        # Get appropriate scraper and fetch data
+        # Run the venue's scrapers and merge their events
         try:
-            scraper = ScraperFactory.get_scraper_for_venue(venue_info)
-            artist_events = scraper.get_events(venue_key, venue_info)
+            artist_events = ScraperFactory.get_events_for_venue(venue_key, venue_info)
             logger.info(f"Found {len(artist_events)} events for {venue_key}")
         except Exception as e:
             logger.error(f"Error getting events for {venue_key}: {str(e)}")
@@ -39,34 +52,42 @@ def process_venue(venue_key: str, output_dir: str = "data/venue-data/sf", force:
         if not artist_events:
             logger.warning(f"No events found for {venue_key}")
             return []
+        
+        store = get_event_store()
+        if store:
+            city = city_from_path(output_dir)
+            store.upsert_venues(city, {venue_key: venue_info})
+            store.replace_events(city, venue_key, artist_events)
             
-        # Process each month
+        # Skip bucketing and writes when the extracted events haven't changed
         months = get_next_months()
+        events_hash = compute_events_hash(artist_events, months)
+        if not force and events_hash == load_events_hash(venue_key, output_dir):
+            existing_files = [
+                str(Path(output_dir) / venue_key / f"artists_{month}.yaml")
+                for month in months
+            ]
+            existing_files = [filename for filename in existing_files if Path(filename).exists()]
+            logger.info(f"Events unchanged for {venue_key}, keeping {len(existing_files)} existing files")
+            return existing_files
+        
+        # Bucket events by (year, month) once instead of rescanning them per month
+        index = EventIndex(artist_events)
         output_files = []
         for month in months:
-            # Filter events for this month
-            month_name = month.split('_')[0].lower()
-            month_events = [
-                event for event in artist_events 
-                if event.date.strftime('%B').lower() == month_name
-            ]
+            unique_events = index.unique_month(*parse_month(month))
             
-            if month_events:
-                # Deduplicate artists while preserving order
-                seen = set()
-                unique_events = []
-                for event in month_events:
-                    if event.name not in seen:
-                        seen.add(event.name)
-                        unique_events.append(event)
-                
+            if unique_events:
                 # Save unique artists for this month
-                filename = save_artists_to_file(venue_key, unique_events, month, output_dir)
+                filename, changed = save_artists_if_changed(venue_key, unique_events, month, output_dir)
                 output_files.append(filename)
-                logger.info(f"Saved {len(unique_events)} unique artists for {month}")
+                if changed and changed_months is not None:
+                    changed_months.append(month)
+                logger.info(f"{'Saved' if changed else 'Kept'} {len(unique_events)} unique artists for {month}")
             else:
                 logger.warning(f"No artists found for {venue_key} in {month}")
         
+        save_events_hash(venue_key, events_hash, output_dir)
         return output_files
         
     except Exception as e:
@@ -0,0 +1,78 @@
+import os
+import pickle
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+import yaml
+from .disk_cache import DiskCache, CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Size cap for parsed-YAML snapshots kept on disk
+YAML_SNAPSHOT_MAX_MB = int(os.environ.get('YAML_SNAPSHOT_MAX_MB', 20))
+
+class YAMLSnapshotCache:
+    """Load YAML files through pickled snapshots keyed by a hash of their content.
+
+    Snapshots are kept in memory for the run and on disk across runs, so an
+    unchanged file is parsed once. Hashing the bytes rather than trusting
+    mtime and size catches same-size rewrites that keep the old timestamp.
+    Each load unpickles a fresh copy, so callers may modify what they get back.
+    """
+
+    def __init__(self, disk_cache: Optional[DiskCache] = None):
+        self.disk_cache = disk_cache
+        self._memory: Dict[str, Tuple[str, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path) -> Any:
+        """Parse a YAML file, or reuse the snapshot of its current version."""
+        path = os.path.abspath(path)
+        with open(path, 'rb') as f:
+            content = f.read()
+        key = hashlib.sha256(content).hexdigest()
+
+        with self._lock:
+            cached = self._memory.get(path)
+        if cached and cached[0] == key:
+            return pickle.loads(cached[1])
+
+        snapshot = None
+        if self.disk_cache is not None:
+            entry = self.disk_cache.get(key)
+            if entry:
+                snapshot = entry[0]
+
+        if snapshot is None:
+            data = yaml.load(content, Loader=SafeLoader)
+            snapshot = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            if self.disk_cache is not None:
+                self.disk_cache.set(key, snapshot, {'path': path})
+            logger.debug(f"Parsed {path}")
+        else:
+            data = pickle.loads(snapshot)
+
+        with self._lock:
+            self._memory[path] = (key, snapshot)
+        return data
+
+_shared_cache: Optional[YAMLSnapshotCache] = None
+_shared_cache_lock = threading.Lock()
+
+def get_yaml_cache() -> YAMLSnapshotCache:
+    """Return the process-wide YAML snapshot cache."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = YAMLSnapshotCache(
+                DiskCache(os.path.join(CACHE_DIR, 'yaml'), YAML_SNAPSHOT_MAX_MB * 1024 * 1024)
+            )
+        return _shared_cache
+
+def load_yaml(path) -> Any:
+    """Load a YAML file through the shared snapshot cache."""
+    return get_yaml_cache().load(path)